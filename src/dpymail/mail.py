@@ -1,12 +1,82 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import email
-from datetime import datetime
+import io
+import re
+import shutil
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from email.header import decode_header
+from email.message import Message
+from email.parser import BytesHeaderParser
 from email.utils import getaddresses
 from html.parser import HTMLParser
 
 from mailaddress import MailAddress
 
+try:
+    from fast_mail_parser import ParseError, parse_email
+except ImportError:
+    # fast_mail_parserが導入されていない場合は標準のemailパッケージで解析する
+    ParseError = None
+    parse_email = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _LexborParser
+except ImportError:
+    _LexborParser = None
+
+try:
+    import lxml.html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+# INTERNALDATE（例: INTERNALDATE "12-Feb-2024 10:20:30 +0900"）の解析用正規表現
+_INTERNALDATE_RE = re.compile(
+    rb'INTERNALDATE "\s?(\d{1,2})-([A-Za-z]{3})-(\d{4}) (\d{2}):(\d{2}):(\d{2}) ([+-])(\d{2})(\d{2})"')
+
+# INTERNALDATEの月名と月の対応
+_MONTHS = {
+    b"Jan": 1, b"Feb": 2, b"Mar": 3, b"Apr": 4, b"May": 5, b"Jun": 6,
+    b"Jul": 7, b"Aug": 8, b"Sep": 9, b"Oct": 10, b"Nov": 11, b"Dec": 12,
+}
+
+# 解析対象のヘッダ名（小文字）とヘッダ値取得時のキーの対応
+_HEADER_NAMES = {"from": "From", "to": "To", "subject": "Subject"}
+
+# 単一のメールアドレス（"名称 <アドレス>"、"<アドレス>"、"アドレス"）の解析用正規表現
+# 名称は<アドレス>が続く場合のみ取得する
+_SIMPLE_ADDR_RE = re.compile(r'"?([^"<]*?)"?\s*<([^<>\s,"]+@[^<>\s,"]+)>|([^<>\s,"]+@[^<>\s,"]+)')
+
+# 添付ファイルを表すContent-Dispositionの値
+_ATTACHMENT = "attachment"
+
+# ASCII文字のみの本文をASCIIとしてデコードしてよい文字コード
+_ASCII_COMPATIBLE_CHARSETS = frozenset(("ascii", "us-ascii", "utf-8"))
+
+# HTML先頭のXML宣言（lxmlは文字列の解析時に文字コード指定を含むXML宣言を受け付けない）
+_XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+# ファイル名として使用できない文字を"_"に置換する変換テーブル
+_FILE_NAME_SAFE_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+
+@lru_cache(maxsize=4096)
+def _make_mailaddress(address: str, name: str) -> MailAddress:
+    """メールアドレスインスタンスを作成して返却
+
+    同じ送信元が繰り返し出現するため、メールアドレスと名称の組み合わせ毎にインスタンスを共有する
+    （MailAddressは生成後に変更されないため共有しても問題ない）
+
+    Args:
+        address (str): メールアドレス文字列
+        name (str): 名称
+
+    Returns:
+        MailAddress: メールアドレスインスタンス
+    """
+    return MailAddress(address, name)
+
 
 class Mail(ABC):
     """メールを表す抽象クラス
@@ -21,6 +91,7 @@ class Mail(ABC):
             mailserveronnection (MailServerConnection): メールサーバコネクション
         """
         self._mailserveronnection = mailserveronnection
+        self._file_name = None
 
     @abstractmethod
     def get_from_mailaddress(self) -> MailAddress:
@@ -81,8 +152,9 @@ class Mail(ABC):
         file_name = self._get_file_name()
         file_path = os.path.join(directory, file_name)
 
+        # メールのバイナリデータをメモリに展開せずにファイルへ書き出す
         with open(file_path, "wb") as f:
-            f.write(self.get_mail_binary_data())
+            shutil.copyfileobj(self.get_body_stream(), f)
 
         return file_path
 
@@ -95,16 +167,26 @@ class Mail(ABC):
         """
         pass
 
+    def get_body_stream(self) -> io.BufferedIOBase:
+        """メールのバイナリデータを先頭から読み込むファイルオブジェクトを取得する
+
+        Returns:
+            io.BufferedIOBase: メールのバイナリデータのファイルオブジェクト
+        """
+        return io.BytesIO(self.get_mail_binary_data())
+
     def _get_file_name(self) -> str:
         """メールを保存する際のファイル名を取得する
 
         Returns:
             str: メール保存用ファイル名
         """
-        date_str = self.get_reception_datetime().strftime("%Y%m%d_%H%M%S")
-        subject_str = self._get_file_name_safe_subject()
-        file_name = f"{date_str}_{subject_str}.eml"
-        return file_name
+        # 一度生成したファイル名は保持し、複数回保存する場合に再生成しない
+        if self._file_name is None:
+            date_str = self.get_reception_datetime().strftime("%Y%m%d_%H%M%S")
+            subject_str = self._get_file_name_safe_subject()
+            self._file_name = f"{date_str}_{subject_str}.eml"
+        return self._file_name
 
     def _get_file_name_safe_subject(self) -> str:
         """件名をファイル名として安全な形式に変換して返却する
@@ -112,12 +194,8 @@ class Mail(ABC):
         Returns:
             str: ファイル名として安全な件名文字列
         """
-        subject = self.get_subject()
         # ファイル名として使用できない文字を置換
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        for char in invalid_chars:
-            subject = subject.replace(char, '_')
-        return subject
+        return self.get_subject().translate(_FILE_NAME_SAFE_TABLE)
 
     def __str__(self) -> str:
         """送信元メールアドレス、送信先メールアドレス、受信日時、件名を文字列化して返却する
@@ -132,75 +210,57 @@ class IMAPMail(Mail):
     """IMAPメールを表すメールクラス
     """
 
-    def __init__(self, uid: bytes, msg_data, mailserveronnection):
+    def __init__(self, uid: int, msg_data, mailserveronnection, headers_only: bool = False, body_loader=None):
         """コンストラクタ
 
         メールサーバコネクションを元にメールインスタンスを生成する
+        メール情報の解析は各情報が初めて参照された時点で実施する
 
         Args:
-            uid (bytes): メールUID
+            uid (int): メールUID
             msg_data : メール情報
             mailserveronnection (MailServerConnection): メールサーバコネクション
+            headers_only (bool, optional): ヘッダ情報のみを解析するか. Defaults to False.
+                送信元、送信先、件名は常にヘッダ部のみを解析して取得するため、互換性のためにのみ受け付ける
+            body_loader (function, optional): メール全体のメール情報をロードする関数. Defaults to None.
+                msg_dataがヘッダ部のみの場合に指定する。UIDを引数に呼び出され、本文が初めて参照された時点でロードする
         """
         super().__init__(mailserveronnection)
         self._uid = uid
         self._msg_data = msg_data
+        self._body_loader = body_loader
 
-        # メールオブジェクトに変換
-        self._mail_obj = email.message_from_bytes(self._msg_data[0][1])
-
-        # 送信元メールアドレス取得
-        self._from_address = self.__get_addresses(
-            self.__decode_mime_header(self._mail_obj.get("From")))
+    @classmethod
+    def from_batch(cls, items, mailserveronnection, workers: int = 8, headers_only: bool = False) -> list["IMAPMail"]:
+        """UIDとメール情報の組の一覧からメールインスタンスを一括生成する
 
-        # 送信先メールアドレス取得
-        self._to_address = self.__get_addresses(
-            self.__decode_mime_header(self._mail_obj.get("To")))
+        メール情報の解析は参照時まで遅延されるため、生成と同時にヘッダ部の解析をスレッドプールで並列に実施する。
 
-        # 受信日時取得
-        # 例: "INTERNALDATE "12-Feb-2024 10:20:30 +0900""をパースし、datetimeオブジェクトに変換
-        # INTERNALDATEはmsg_dataの2番目に含まれる
-        # タイムゾーンはローカルタイムゾーンに変換する
-        self._reception_datetime_str = self._msg_data[1].decode().split(
-            'INTERNALDATE')[-1].strip(" )\"")
-        self._reception_datetime = datetime.strptime(
-            self._reception_datetime_str, "%d-%b-%Y %H:%M:%S %z").astimezone(tz=None)
+        Args:
+            items : UIDとメール情報の組の一覧
+            mailserveronnection (MailServerConnection): メールサーバコネクション
+            workers (int, optional): 並列実行数. Defaults to 8.
+            headers_only (bool, optional): ヘッダ情報のみを解析するか（互換性のためにのみ受け付ける）. Defaults to False.
 
-        # 件名取得
-        self._subject = self.__decode_mime_header(self._mail_obj["Subject"])
+        Returns:
+            list[IMAPMail]: メールインスタンス一覧（引数の順序を保持する）
+        """
+        def create(item) -> "IMAPMail":
+            uid, msg_data = item
+            return cls(uid, msg_data, mailserveronnection, headers_only=headers_only)._preload_headers()
 
-        # 本文取得
-        self._body_org = None
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(create, items))
 
-        # マルチパートメールの場合
-        if self._mail_obj.is_multipart():
-            self._is_multipart = True
-            for part in self._mail_obj.walk():
-                self._content_type = part.get_content_type()
-                content_disposition = str(part.get("Content-Disposition"))
-                # 添付ファイルでないテキスト部分を探す
-                if self._content_type == "text/plain" and "attachment" not in content_disposition:
-                    self._body_org = part.get_payload(decode=True).decode(
-                        part.get_content_charset() or "utf-8", errors="ignore")
-                    break
+    def _preload_headers(self) -> "IMAPMail":
+        """ヘッダ部を解析し、解析結果をインスタンスに保持させる
 
-        # シングルパートメールの場合
-        else:
-            self._is_multipart = False
-            self._content_type = self._mail_obj.get_content_type()
-            self._body_org = self._mail_obj.get_payload(decode=True).decode(
-                self._mail_obj.get_content_charset() or "utf-8", errors="ignore")
-
-        # 本文オブジェクト作成
-        if self._body_org:
-            if self._content_type == "text/html":
-                self._mail_body = HTMLMailBody(
-                    self._content_type, self._body_org)
-            else:
-                self._mail_body = PlainTextMailBody(
-                    self._content_type, self._body_org)
-        else:
-            self._mail_body = PlainTextMailBody("text/plain", "")
+        Returns:
+            IMAPMail: 本インスタンス
+        """
+        # cached_propertyは初回参照時の解析結果をインスタンスに保持するため、参照のみ行う
+        _ = self._header_values
+        return self
 
     def get_from_mailaddress(self) -> MailAddress:
         """送信元メールアドレスを取得する
@@ -248,8 +308,246 @@ class IMAPMail(Mail):
         Returns:
             bytes: メールのバイナリデータ
         """
+        # 受信したメールデータをそのまま返却する（再シリアライズはしない）
+        data = self._full_msg_data[0][1]
+        if isinstance(data, bytes):
+            return data
+        data.seek(0)
+        return data.read()
+
+    def get_body_stream(self) -> io.BufferedIOBase:
+        """メールのバイナリデータを先頭から読み込むファイルオブジェクトを取得する
+
+        サイズの大きいメールはメールサーバからの受信時に一時ファイルへ書き出されているため、メモリに展開せずに読み込める。
+        返却するファイルオブジェクトはメールインスタンスで共有しているため、クローズしないこと。
+
+        Returns:
+            io.BufferedIOBase: メールのバイナリデータのファイルオブジェクト
+        """
+        data = self._full_msg_data[0][1]
+        if isinstance(data, bytes):
+            return io.BytesIO(data)
+        data.seek(0)
+        return data
+
+    def get_serialized_bytes(self) -> bytes:
+        """解析したメールオブジェクトを再シリアライズしたバイナリデータを取得する
+
+        受信したメールデータそのものが必要な場合はget_mail_binary_dataを使用すること
+
+        Returns:
+            bytes: 再シリアライズしたメールのバイナリデータ
+        """
         return self._mail_obj.as_bytes()
 
+    @cached_property
+    def _full_msg_data(self):
+        """メール全体のメール情報
+
+        ヘッダ部のみのメール情報を保持している場合、初めて参照された時点でメール全体をロードする
+
+        Returns:
+            メール全体のメール情報
+        """
+        if self._body_loader is not None:
+            return self._body_loader(self._uid)
+        return self._msg_data
+
+    @cached_property
+    def _fast_mail_obj(self):
+        """fast_mail_parserで解析したメールオブジェクト
+
+        fast_mail_parserが解析できないメール（不正なBase64のパートを含む場合など）は標準のemailパッケージで解析するため、Noneとする
+
+        Returns:
+            PyMail: メールオブジェクト（fast_mail_parserが利用できない場合、解析に失敗した場合はNone）
+        """
+        if parse_email is None:
+            return None
+        try:
+            return parse_email(self.get_mail_binary_data())
+        except ParseError:
+            return None
+
+    @cached_property
+    def _mail_obj(self) -> Message:
+        """標準のemailパッケージで解析したメールオブジェクト
+
+        Returns:
+            Message: メールオブジェクト
+        """
+        data = self._full_msg_data[0][1]
+        if isinstance(data, bytes):
+            return email.message_from_bytes(data)
+        # 一時ファイルに書き出されたメールは、バイナリデータ全体をメモリに展開せずに解析する
+        return email.message_from_binary_file(self.get_body_stream())
+
+    @cached_property
+    def _header_obj(self) -> Message:
+        """ヘッダ部のみを解析したメールオブジェクト
+
+        ヘッダと本文の区切りで解析を終了するため、本文や添付ファイルのパートは生成しない
+
+        Returns:
+            Message: ヘッダ部のみのメールオブジェクト
+        """
+        data = self._msg_data[0][1]
+        if isinstance(data, bytes):
+            return BytesHeaderParser().parsebytes(data)
+        # 一時ファイルに書き出されたメールは、ファイルオブジェクトから解析する
+        data.seek(0)
+        return BytesHeaderParser().parse(data)
+
+    @cached_property
+    def _header_values(self) -> dict[str, str]:
+        """送信元、送信先、件名のヘッダ値
+
+        本文の解析方法によらず、ヘッダ部のみを解析する（ヘッダの参照のためにメール全体を解析しない）
+
+        Returns:
+            dict[str, str]: ヘッダ名をキーとしたヘッダ値
+        """
+        # 必要なヘッダをヘッダ一覧の1回の走査で取得する（同名ヘッダが複数ある場合は最初の値を採用する）
+        header_values = dict.fromkeys(_HEADER_NAMES.values())
+        for name, value in self._header_obj.items():
+            header_name = _HEADER_NAMES.get(name.lower())
+            if header_name is not None and header_values[header_name] is None:
+                header_values[header_name] = value
+        return header_values
+
+    @cached_property
+    def _body_content(self) -> tuple[str, str]:
+        """本文のコンテンツタイプと本文
+
+        fast_mail_parserで解析できた場合はその結果を使用し、それ以外の場合は標準のemailパッケージで解析する。
+        本文のデコードは解析方法により以下のように異なる。
+            fast_mail_parser: fast_mail_parserのデコード結果をそのまま使用する（BOMがある場合は指定の文字コードよりBOMを優先し、
+                文字コードの指定がない場合はISO-8859-1、未知の文字コードの場合は置換文字を含む文字列となる）
+            emailパッケージ: 指定の文字コードでデコードする（文字コードの指定がない場合、未知の文字コードの場合はUTF-8）
+
+        Returns:
+            tuple[str, str]: 本文のコンテンツタイプ、本文
+        """
+        if self._fast_mail_obj is not None:
+            # テキスト部分を優先し、存在しない場合はHTML部分を本文とする
+            if self._fast_mail_obj.text_plain:
+                return "text/plain", self._fast_mail_obj.text_plain[0]
+            if self._fast_mail_obj.text_html:
+                return "text/html", self._fast_mail_obj.text_html[0]
+            return "text/plain", None
+
+        # マルチパートメールの場合
+        if self._mail_obj.is_multipart():
+            # 添付ファイルでないテキスト部分、HTML部分を1回の走査で探す
+            # テキスト部分が見つかった時点でHTML部分は不要となるため走査を終了する
+            html_part = None
+            body_part = None
+            for part in self._mail_obj.walk():
+                content_disposition = part.get("Content-Disposition")
+                if content_disposition is not None and _ATTACHMENT in str(content_disposition).lower():
+                    continue
+                content_type = part.get_content_type()
+                if content_type == "text/plain":
+                    body_part = part
+                    break
+                if content_type == "text/html" and html_part is None:
+                    html_part = part
+
+            # テキスト部分を優先し、存在しない場合はHTML部分を本文とする
+            if body_part is None:
+                body_part = html_part
+            if body_part is None:
+                return "text/plain", None
+
+        # シングルパートメールの場合
+        else:
+            body_part = self._mail_obj
+
+        return body_part.get_content_type(), self.__decode_payload(body_part)
+
+    def __decode_payload(self, part: Message) -> str:
+        """メールパートの本文をデコードする
+
+        パートに指定された文字コードでデコードし、指定がない場合、未知の文字コードの場合はUTF-8としてデコードする。
+        ASCII互換の文字コードでASCII文字のみの場合はASCIIとしてデコードする。
+
+        Args:
+            part (Message): デコード対象のメールパート
+
+        Returns:
+            str: デコードした本文
+        """
+        payload = part.get_payload(decode=True)
+        charset = (part.get_content_charset() or "utf-8").lower()
+        if charset in _ASCII_COMPATIBLE_CHARSETS and payload.isascii():
+            return payload.decode("ascii")
+        try:
+            return payload.decode(charset, errors="ignore")
+        except LookupError:
+            return payload.decode("utf-8", errors="ignore")
+
+    @cached_property
+    def _from_address(self) -> list[MailAddress]:
+        """送信元メールアドレス一覧
+
+        Returns:
+            list[MailAddress]: 送信元メールアドレス一覧
+        """
+        return self.__get_addresses(self.__decode_mime_header(self._header_values["From"]))
+
+    @cached_property
+    def _to_address(self) -> list[MailAddress]:
+        """送信先メールアドレス一覧
+
+        Returns:
+            list[MailAddress]: 送信先メールアドレス一覧
+        """
+        return self.__get_addresses(self.__decode_mime_header(self._header_values["To"]))
+
+    @cached_property
+    def _reception_datetime(self) -> datetime:
+        """受信日時
+
+        Returns:
+            datetime: 受信日時
+        """
+        # 例: "INTERNALDATE "12-Feb-2024 10:20:30 +0900""をパースし、datetimeオブジェクトに変換
+        # INTERNALDATEはサーバや取得項目によりリテラルの前（msg_data[0][0]）、後（msg_data[1]以降）のいずれかに含まれる
+        # strptimeはメール毎に書式を解釈し直すため、事前コンパイル済みの正規表現で各値を切り出す
+        # タイムゾーンはローカルタイムゾーンに変換する
+        fetch_items = b" ".join(
+            [self._msg_data[0][0], *(item for item in self._msg_data[1:] if isinstance(item, bytes))])
+        day, month, year, hour, minute, second, tz_sign, tz_hour, tz_minute = _INTERNALDATE_RE.search(
+            fetch_items).groups()
+        tz_offset = timedelta(hours=int(tz_hour), minutes=int(tz_minute))
+        if tz_sign == b"-":
+            tz_offset = -tz_offset
+        return datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second),
+                        tzinfo=timezone(tz_offset)).astimezone(tz=None)
+
+    @cached_property
+    def _subject(self) -> str:
+        """件名
+
+        Returns:
+            str: 件名
+        """
+        return self.__decode_mime_header(self._header_values["Subject"])
+
+    @cached_property
+    def _mail_body(self) -> "MailBody":
+        """メール本文インスタンス
+
+        Returns:
+            MailBody: メール本文インスタンス
+        """
+        content_type, body = self._body_content
+        if body:
+            if content_type == "text/html":
+                return HTMLMailBody(content_type, body)
+            return PlainTextMailBody(content_type, body)
+        return PlainTextMailBody("text/plain", "")
+
     def __decode_mime_header(self, value) -> str:
         """MIMEヘッダーをデコードｊ
 
@@ -263,15 +561,12 @@ class IMAPMail(Mail):
             return ""
 
         # MIMEエンコードを元に戻す。
-        decoded_parts = decode_header(value)
-
-        decoded_str = ""
-        for part, enc in decoded_parts:
-            if isinstance(part, bytes):
-                decoded_str += part.decode(enc or "utf-8", errors="ignore")
-            else:
-                decoded_str += part
-        return decoded_str
+        # エンコードワードが多い場合に文字列連結を繰り返さないよう、リストに集めてから結合する
+        decoded_parts = []
+        append = decoded_parts.append
+        for part, enc in decode_header(value):
+            append(part.decode(enc or "utf-8", errors="ignore") if isinstance(part, bytes) else part)
+        return "".join(decoded_parts)
 
     def __get_addresses(self, header_value) -> list[MailAddress]:
         """メールアドレス取得
@@ -286,6 +581,14 @@ class IMAPMail(Mail):
         """
         if not header_value:
             return []
+
+        # 単一アドレスの場合（"名称 <アドレス>"、"アドレス"など）は正規表現で抽出する
+        if "," not in header_value:
+            matched = _SIMPLE_ADDR_RE.fullmatch(header_value.strip())
+            if matched is not None:
+                name, bracketed_addr, bare_addr = matched.groups()
+                return [self._create_mailaddress_instance(bracketed_addr or bare_addr, " ".join((name or "").split()))]
+
         # ヘッダ（From, To など）からメールアドレスを抽出
         # 複数宛先がある場合はリストで返す
         addresses = getaddresses([header_value])
@@ -301,7 +604,7 @@ class IMAPMail(Mail):
         Returns:
             MailAddress: メールアドレスインスタンス
         """
-        return MailAddress(address, name)
+        return _make_mailaddress(address, name)
 
 
 class MailBody(ABC):
@@ -371,9 +674,47 @@ class HTMLMailBody(MailBody):
         """
         super().__init__(content_type, content)
 
-        # HTMLをパースし保持する
-        self._html_content = self._HtmlParser()
-        self._html_content.feed(content)
+    @classmethod
+    def _extract_text(cls, content: str) -> str:
+        """HTMLからテキストを抽出する
+
+        selectolax、lxmlの順に利用可能なC実装のパーサを使用し、いずれも利用できない場合は標準のHTMLParserを使用する
+        いずれのパーサでも、空白のみのテキストを除いたテキストをそのまま連結する
+
+        Args:
+            content (str): HTML文字列
+
+        Returns:
+            str: 抽出したテキスト
+        """
+        if _LexborParser is not None:
+            root = _LexborParser(content).root
+            if root is None:
+                return ""
+            return "".join(
+                node.text_content for node in root.traverse(include_text=True)
+                if node.tag == "-text" and node.text_content.strip())
+
+        if _lxml_html is not None:
+            content = _XML_DECLARATION_RE.sub("", content, count=1)
+            if not content.strip():
+                return ""
+            return "".join(text for text in _lxml_html.fromstring(content).itertext() if text.strip())
+
+        html_parser = cls._HtmlParser()
+        html_parser.feed(content)
+        return html_parser.get_text()
+
+    @cached_property
+    def _text(self) -> str:
+        """HTMLから抽出したテキスト
+
+        HTMLの解析は初めて参照された時点で実施する
+
+        Returns:
+            str: 抽出したテキスト
+        """
+        return self._extract_text(self._content)
 
     def __str__(self):
-        return self._html_content.get_text()
+        return self._text
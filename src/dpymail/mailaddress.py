@@ -1,7 +1,24 @@
+import re
+
+# メールアドレスをユーザ部（ベース名、プラスアドレスのタグ名）、ドメイン部に分割する正規表現
+_ADDR_RE = re.compile(r"^(?P<user>(?P<base>[^+@]*)(?:\+(?P<tag>[^@]*))?)@(?P<domain>.*)$")
+
+
 class MailAddress:
     """メールアドレスを表すクラス
     """
 
+    __slots__ = (
+        "_mailaddress",
+        "_has_name",
+        "_name",
+        "_mailaddress_user_area",
+        "_mailaddress_domain_area",
+        "_is_plusaddress",
+        "_mailaddress_user_plus_base_user_area",
+        "_mailaddress_user_plus_tag_area",
+    )
+
     def __init__(self, mailaddress: str, name: str):
         """コンストラクタ
 
@@ -20,21 +37,18 @@ class MailAddress:
             self._has_name = False
             self._name = ""
 
-        # メールアドレスをユーザ部、ドメイン部で分割して保持
-        user, domain = mailaddress.split("@", 1)
-        self._mailaddress_user_area = user
-        self._mailaddress_dmail_area = domain
+        # メールアドレスをユーザ部（プラスアドレスの場合はベース名、タグ名）、ドメイン部に分割して保持
+        matched = _ADDR_RE.match(mailaddress)
+        if matched is None:
+            raise ValueError(f"Invalid mail address. mailaddress={mailaddress}")
+        self._mailaddress_user_area = matched["user"]
+        self._mailaddress_domain_area = matched["domain"]
 
         # ユーザ部にプラスアドレスであるか確認する
-        if "+" in user:
-            self._is_plusaddress = True
-            base_user, tag = user.split("+", 1)
-            self._mailaddress_user_plus_bsae_user_area = base_user
-            self._mailaddress_user_plus_tag_area = tag
-        else:
-            self._is_plusaddress = False
-            self._mailaddress_user_plus_bsae_user_area = user
-            self._mailaddress_user_plus_tag_area = ""
+        tag = matched["tag"]
+        self._is_plusaddress = tag is not None
+        self._mailaddress_user_plus_base_user_area = matched["base"]
+        self._mailaddress_user_plus_tag_area = tag or ""
 
     def get_mailaddress(self) -> str:
         """メールアドレスを取得する
@@ -86,7 +100,7 @@ class MailAddress:
         Returns:
             str: プラスアドレスのベース名
         """
-        return self._mailaddress_user_plus_bsae_user_area
+        return self._mailaddress_user_plus_base_user_area
 
     def get_plusaddress_tagname(self) -> str:
         """プラスアドレスのタグ名（+の後半部）を返却する
@@ -104,10 +118,10 @@ class MailAddress:
         Returns:
             str: メールアドレスのドメイン部
         """
-        return self._mailaddress_dmail_area
+        return self._mailaddress_domain_area
 
     def __str__(self):
-        if self.has_name():
-            return f"{self.get_name()} <{self.get_mailaddress()}>"
+        if self._has_name:
+            return f"{self._name} <{self._mailaddress}>"
         else:
-            return f"{self.get_mailaddress()}"
+            return self._mailaddress
@@ -1,10 +1,220 @@
 from abc import ABC, abstractmethod
+import asyncio
+import atexit
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+import hashlib
 import imaplib
+import re
+import select
 import socket
+import ssl
+import tempfile
+import threading
+import time
+try:
+    from itertools import batched
+except ImportError:
+    # Python 3.12未満の場合
+    from itertools import islice
+
+    def batched(iterable, n):
+        iterator = iter(iterable)
+        while chunk := tuple(islice(iterator, n)):
+            yield chunk
+
+try:
+    import aioimaplib
+except ImportError:
+    aioimaplib = None
 
 from mail import Mail, IMAPMail
 from exception.dpymailexception import MailServerConnectException, MailLoadException, MailMonitoringTimeoutException, MailMessageDataNotFoundException
 
+# FETCH応答のメール毎の先頭要素（例: b'1 (UID 1 INTERNALDATE "..." BODY[] {size}'）から番号を取得する正規表現
+_FETCH_ID_RE = re.compile(rb"(\d+) \(")
+
+# FETCH応答のメール毎の要素からUIDを取得する正規表現
+_FETCH_UID_RE = re.compile(rb"UID (\d+)")
+
+# parallel_fetchで同時に使用するコネクション数の上限
+_MAX_PARALLEL_CONNECTIONS = 10
+
+# 返却済みのIMAP接続のプール（キー: ホスト名、ポート番号、ユーザ名、パスワードのハッシュ値、メールボックス）
+# parallel_fetchで作成した接続を再利用できるよう、接続先毎に_MAX_PARALLEL_CONNECTIONSまで返却順に保持する
+_CONNECTION_POOL: dict[tuple[str, int, str, str, str], list["IMAPSSLConnection"]] = {}
+_CONNECTION_POOL_LOCK = threading.Lock()
+
+# 一時ファイルへ書き出しながら受信するリテラル（メールデータ）の最小サイズ
+_STREAM_LITERAL_MIN_SIZE = 1024 * 1024
+
+# リテラルを一時ファイルへ書き出す際の1回の読み込みサイズ
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# IDLE中に受けた場合にメールボックスに変化があったとみなす応答（新着メール、メールの削除）
+_MAILBOX_CHANGE_RESPONSES = (b"EXISTS", b"EXPUNGE")
+
+# 返却済みの接続を再利用する最大の経過秒数
+_POOL_IDLE_TIMEOUT_SEC = 25 * 60
+
+# ロード済みのヘッダ情報のキャッシュ（キー: ホスト名、ユーザ名、メールボックス、UIDVALIDITY、UID、取得項目）
+# UIDが割り当てられたメールのヘッダは変化しないため、同一UIDVALIDITYの間は再FETCHせずに再利用する
+_HEADER_CACHE: OrderedDict[tuple, list] = OrderedDict()
+_HEADER_CACHE_LOCK = threading.Lock()
+
+# ヘッダ情報のキャッシュの最大件数
+_HEADER_CACHE_MAXSIZE = 1000
+
+
+def _to_message_set(uid_list) -> bytes:
+    """UID一覧をFETCHのメッセージセットに変換する
+
+    連続するUIDは範囲指定にまとめる（例: [1, 2, 3, 5, 7, 8] -> b"1:3,5,7:8"）
+
+    Args:
+        uid_list: UID一覧
+
+    Returns:
+        bytes: メッセージセット
+    """
+    ranges = []
+    start = end = None
+    for uid in uid_list:
+        if end is not None and uid == end + 1:
+            end = uid
+            continue
+        if start is not None:
+            ranges.append(f"{start}:{end}" if start != end else f"{start}")
+        start = end = uid
+    if start is not None:
+        ranges.append(f"{start}:{end}" if start != end else f"{start}")
+    return ",".join(ranges).encode()
+
+
+def _find_fetch_uid(msg_data: list) -> int:
+    """メール毎のFETCH応答からUIDを取得する
+
+    UIDはリテラルの前後いずれにも出現し得るため、リテラル以外の要素を先頭から検索する。
+
+    Args:
+        msg_data (list): メール毎のFETCH応答
+
+    Returns:
+        int: UID（応答にUIDが含まれない場合None）
+    """
+    for item in msg_data:
+        matched = _FETCH_UID_RE.search(item[0] if isinstance(item, tuple) else item)
+        if matched is not None:
+            return int(matched.group(1))
+    return None
+
+
+def _parse_uids(raw: bytes, tail_count: int = None) -> list[int]:
+    """SEARCHの応答（b'1 2 3 4 5 6 7 8...'）をUID一覧に変換する
+
+    tail_countを指定した場合、末尾から区切り文字を検索して末尾の要素のみを変換し、不要なUIDの分割、変換を行わない。
+
+    Args:
+        raw (bytes): SEARCHの応答
+        tail_count (int, optional): 末尾から取得するUIDの数. Defaults to None.
+
+    Returns:
+        list[int]: UID一覧
+    """
+    if tail_count is not None:
+        if tail_count <= 0:
+            return []
+        raw = raw.rstrip()
+        index = len(raw)
+        for _ in range(tail_count):
+            index = raw.rfind(b" ", 0, index)
+            if index < 0:
+                break
+        raw = raw[index + 1:]
+    return [int(uid) for uid in raw.split()]
+
+
+def _connection_pool_key(host: str, port: int, username: str, password: str, mailbox: str) -> tuple[str, int, str, str, str]:
+    """接続のプールのキーを取得する
+
+    異なるパスワードで取得した接続を再利用しないよう、パスワードのハッシュ値をキーに含める。
+
+    Args:
+        host (str): IMAPサーバホスト名
+        port (int): IMAPサーバポート番号
+        username (str): IMAPサーバユーザ名
+        password (str): IMAPサーバパスワード
+        mailbox (str): 参照先メールボックス
+
+    Returns:
+        tuple[str, int, str, str, str]: ホスト名、ポート番号、ユーザ名、パスワードのハッシュ値、メールボックス
+    """
+    return (host, port, username, hashlib.sha256(password.encode()).hexdigest(), mailbox)
+
+
+def close_pool() -> None:
+    """返却済みのIMAP接続をすべて切断し、接続のプールを空にする
+
+    プロセス終了時にも実行する。
+    """
+    with _CONNECTION_POOL_LOCK:
+        connections = [connection for pooled in _CONNECTION_POOL.values() for connection in pooled]
+        _CONNECTION_POOL.clear()
+    for connection in connections:
+        connection.disconnect()
+
+
+atexit.register(close_pool)
+
+
+class _StreamingIMAP4_SSL(imaplib.IMAP4_SSL):
+    """サイズの大きいリテラルを一時ファイルへ書き出しながら受信するIMAP4_SSL
+
+    imaplibは応答のリテラルを一括で読み込むため、添付ファイルを含むメールではメール全体がメモリに展開される。
+    _STREAM_LITERAL_MIN_SIZE以上のリテラルは一定サイズ毎に読み込んで一時ファイル（一定サイズまではメモリ上）へ書き出し、
+    bytesの代わりに先頭にシークしたファイルオブジェクトを応答に格納する。
+    """
+
+    def read(self, size: int):
+        """リテラルを読み込む
+
+        Args:
+            size (int): リテラルのサイズ
+
+        Returns:
+            リテラル（_STREAM_LITERAL_MIN_SIZE以上の場合はファイルオブジェクト、それ以外はbytes）
+        """
+        if size < _STREAM_LITERAL_MIN_SIZE:
+            return super().read(size)
+
+        spool = tempfile.SpooledTemporaryFile(max_size=_STREAM_LITERAL_MIN_SIZE)
+        remaining = size
+        while remaining > 0:
+            chunk = self.file.read(min(remaining, _STREAM_CHUNK_SIZE))
+            if not chunk:
+                spool.close()
+                raise self.abort("socket error: EOF")
+            spool.write(chunk)
+            remaining -= len(chunk)
+        spool.seek(0)
+        return spool
+
+
+class FetchProfile(Enum):
+    """メール取得時にメールサーバから取得する項目を表す列挙型
+
+    いずれもBODY.PEEKで取得するため、取得によりメールが既読（\\Seen）にはならない。
+    メール全体を取得しない場合、本文は参照された時点で取得する。
+    """
+
+    # UID、受信日時、ヘッダ部
+    HEADERS_ONLY = "(UID INTERNALDATE BODY.PEEK[HEADER])"
+    # UID、受信日時、メール全体
+    FULL = "(UID INTERNALDATE BODY.PEEK[])"
+    # UID、受信日時、送信元、送信先、件名、日付のヘッダ
+    ENVELOPE = "(UID INTERNALDATE BODY.PEEK[HEADER.FIELDS (FROM TO SUBJECT DATE)])"
+
 
 class MailServerConnection(ABC):
     """メールサーバとの接続を表す抽象クラス
@@ -20,24 +230,28 @@ class MailServerConnection(ABC):
         return MailCheckPoint(self, lastest_mail)
 
     @abstractmethod
-    def lastest_mail(self) -> Mail:
+    def lastest_mail(self, fetch_profile: FetchProfile = FetchProfile.HEADERS_ONLY) -> Mail:
         """メールボックスから最も新しいメールを取得する
 
         メールが存在しない場合Noneを返却する。
 
+        Args:
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.HEADERS_ONLY.
+
         Returns:
             Mail: 最も新しいメール
         """
         pass
 
     @abstractmethod
-    def lastest_mail_by_count(self, getmailcount: int) -> list[Mail]:
+    def lastest_mail_by_count(self, getmailcount: int, fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
         """メールボックスから最も新しいメールを指定された数取得する
 
         メールが存在しない場合空のリストを返却する。
 
         Args:
             getmailcount (int): 取得対象のメール数
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
 
         Returns:
             list[Mail]: 最も新しいメール一覧
@@ -45,13 +259,14 @@ class MailServerConnection(ABC):
         pass
 
     @abstractmethod
-    def lastest_mail_over_than_arg_mail(self, mail: Mail) -> list[Mail]:
+    def lastest_mail_over_than_arg_mail(self, mail: Mail, fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
         """メールボックスから指定されたメールよりも新しいメールを取得する
 
         メールが存在しない場合空のリストを返却する。
 
         Args:
             mail (Mail): 基準メール
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
 
         Returns:
             list[Mail]: 指定されたメールよりも新しいメール一覧
@@ -73,6 +288,37 @@ class MailServerConnection(ABC):
         """
         pass
 
+    @abstractmethod
+    def release(self) -> None:
+        """メールサーバコネクションを再利用できるよう返却する
+
+        返却したコネクションは以降使用しないこと。
+        """
+        pass
+
+    @abstractmethod
+    def is_idle_supported(self) -> bool:
+        """メールサーバが新着メールの通知待ち（IDLE）に対応しているかの判定結果を返却する
+
+        Returns:
+            bool: True：対応している、False：対応していない
+        """
+        pass
+
+    @abstractmethod
+    def idle(self, timeout_sec: float) -> bool:
+        """メールサーバからの新着メールの通知を待機する
+
+        通知を受けた場合、またはタイムアウト時間が経過した場合に待機を終了する。
+
+        Args:
+            timeout_sec (float): 待機の最大秒数
+
+        Returns:
+            bool: True：新着メール、メールの削除の通知を受けた、False：通知を受けなかった
+        """
+        pass
+
 
 class IMAPSSLConnection(MailServerConnection):
     """IMAPメールサーバとの接続を表すクラス
@@ -81,7 +327,8 @@ class IMAPSSLConnection(MailServerConnection):
         imap (IMAP4_SSL): IMAP接続インスタンス
     """
 
-    def __init__(self, host: str, port: int, username: str, password: str, timeout: float = 10, mailbox: str = "INBOX"):
+    def __init__(self, host: str, port: int, username: str, password: str, timeout: float = 10, mailbox: str = "INBOX",
+                 fetch_batch_size: int = 100):
         """コンストラクタ
 
         引数に指定されたIMAPサーバ接続情報を元にIMAP接続を実施し、接続できた場合その接続を保持する。
@@ -93,6 +340,7 @@ class IMAPSSLConnection(MailServerConnection):
             password (str): IMAPサーバパスワード
             timeout (float, optional): 接続タイムアウト時間. Defaults to 10.
             mailbox (str): 参照先メールボックス. Detaults to "INBOX"
+            fetch_batch_size (int, optional): 1回のFETCHで取得するメールの最大数. Defaults to 100.
 
         Raises:
             MailServerConnectException: IMAPサーバへの接続に失敗した場合
@@ -103,9 +351,11 @@ class IMAPSSLConnection(MailServerConnection):
         self._password = password
         self._timeout = timeout
         self._mailbox = mailbox
+        self._fetch_batch_size = fetch_batch_size
+        self._released_at = time.monotonic()
 
         try:
-            self.imap = imaplib.IMAP4_SSL(
+            self.imap = _StreamingIMAP4_SSL(
                 host=host, port=port, timeout=timeout)
         except socket.gaierror as e:
             raise MailServerConnectException(
@@ -115,56 +365,78 @@ class IMAPSSLConnection(MailServerConnection):
         except imaplib.IMAP4.error as e:
             raise MailServerConnectException(
                 f"Fail to Login. username={username}, password=**********", e)
-        self.imap.select(mailbox)
+        self.__select_mailbox()
 
-    def lastest_mail(self) -> Mail:
+        # ログイン後のCAPABILITYからIDLEに対応しているかを確認する
+        status, capabilities = self.imap.capability()
+        self._idle_supported = status == "OK" and b"IDLE" in capabilities[0].upper().split()
+
+    def __select_mailbox(self) -> None:
+        """参照先メールボックスを選択する
+
+        選択時の応答からUIDVALIDITYを保持する。
+        """
+        self.imap.select(self._mailbox)
+        # UIDVALIDITYが変化した場合はUIDが振り直されているため、キャッシュのキーに含める
+        _, uidvalidity = self.imap.response("UIDVALIDITY")
+        self._uidvalidity = uidvalidity[0] if uidvalidity and uidvalidity[0] else None
+
+    def lastest_mail(self, fetch_profile: FetchProfile = FetchProfile.HEADERS_ONLY) -> Mail:
         """メールボックスから最も新しいメールを取得する
 
         メールが存在しない場合Noneを返却する。
 
+        Args:
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.HEADERS_ONLY.
+
         Returns:
             Mail: 最も新しいメール
         """
-        lastestmail = self.lastest_mail_by_count(1)
+        lastestmail = self.lastest_mail_by_count(1, fetch_profile)
         if lastestmail:
             return lastestmail[0]
         else:
             return None
 
-    def lastest_mail_by_count(self, getmailcount: int) -> list[Mail]:
+    def lastest_mail_by_count(self, getmailcount: int, fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
         """メールボックスから最も新しいメールを指定された数取得する
 
         メールが存在しない場合空のリストを返却する。
 
         Args:
             getmailcount (int): 取得対象のメール数
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
 
         Returns:
             list[Mail]: 最も新しいメール一覧
         """
-        uid_list = self._search_all()
-        # メールがない場合、Noneを返却
-        if uid_list is None:
+        # 全メールのUIDを検索せず、メール数から末尾のメッセージ番号の範囲を直接FETCHする
+        # （全メールが取得対象個数以下の場合、全量）
+        message_count = self._count_messages()
+        # メールがない場合、空のリストを返却
+        if message_count == 0 or getmailcount <= 0:
             return []
+        first_message_number = max(1, message_count - getmailcount + 1)
 
-        lastest_uid_list = None
-        # 全メールが取得対象個数以下の場合、全量を返却
-        if len(uid_list) <= getmailcount:
-            lastest_uid_list = uid_list
-
-        # 取得対象個数を最後から切り出して返却
-        else:
-            lastest_uid_list = uid_list[(getmailcount * -1):]
+        message_sets = [
+            _to_message_set(range(start, min(start + self._fetch_batch_size, message_count + 1)))
+            for start in range(first_message_number, message_count + 1, self._fetch_batch_size)]
+        data = self._pipelined_fetch(message_sets, fetch_profile.value, by_uid=False)
+        msg_data_by_id = self._split_fetch_response(data)
+        msg_data_by_id.pop(None, None)
+        if fetch_profile is not FetchProfile.FULL and self._uidvalidity is not None:
+            self.__put_cached_headers(msg_data_by_id, fetch_profile)
 
-        # UIDからメール情報をロードし、メールインスタンスへ変換し返却
-        return [self.__load_mail_by_uid(uid) for uid in lastest_uid_list]
+        # メッセージ番号の順序とUIDの順序は一致するため、UIDの昇順でメールインスタンスへ変換し返却
+        return list(self._create_mails_from_msg_data(sorted(msg_data_by_id), msg_data_by_id, fetch_profile))
 
-    def lastest_mail_over_than_arg_mail(self, mail: Mail) -> list[Mail]:
+    def lastest_mail_over_than_arg_mail(self, mail: Mail, fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
         """メールボックスから指定されたメールよりも新しいメールを取得する
 
         メールが存在しない場合空のリストを返却する
         Args:
             mail (Mail): 基準メール
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
 
         Returns:
             list[Mail]: 指定されたメールよりも新しいメール一覧
@@ -174,31 +446,151 @@ class IMAPSSLConnection(MailServerConnection):
         if uid_list is None:
             return []
 
-        # UIDからメール情報をロードし、メールインスタンスへ変換し返却
-        mails = []
-        for uid in uid_list:
-            try:
-                mails.append(self.__load_mail_by_uid(uid))
-            except MailMessageDataNotFoundException:
-                # UIDに該当するメールデータが存在しない場合はその時点でスキップ
+        # UIDからメール情報を一括でロードし、メールインスタンスへ変換し返却
+        # UIDに該当するメールデータが存在しない場合はその時点までのメールが返却される
+        return list(self._fetch_many(uid_list, fetch_profile))
+
+    def parallel_fetch(self, uid_list: list[int], n_conn: int = 3, fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
+        """UID一覧のメールを複数のメールサーバコネクションで並列に取得する
+
+        新しいメールサーバコネクションをn_conn個作成し、UID一覧を連続した範囲に分割して各コネクションで並列にFETCHする。
+        作成したコネクションは取得完了後に返却し、以降のparallel_fetchで再利用する（close_poolで切断できる）。
+        UIDに該当するメールデータが存在しない場合、その直前のUIDまでのメールを返却する。
+
+        Args:
+            uid_list (list[int]): 取得対象のメールのUID一覧
+            n_conn (int, optional): 並列に使用するコネクション数（最大10）. Defaults to 3.
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
+
+        Raises:
+            MailServerConnectException: メールサーバへの接続に失敗した場合
+            MailLoadException: メール読み込みに失敗した場合
+
+        Returns:
+            list[Mail]: メール一覧（引数のUID一覧の順序を保持する）
+        """
+        # 多くのサーバは同時接続数を10〜15程度に制限しているため上限を設ける
+        n_conn = min(n_conn, _MAX_PARALLEL_CONNECTIONS, len(uid_list))
+        if n_conn <= 1:
+            return list(self._fetch_many(uid_list, fetch_profile))
+
+        # imaplibのコネクションはスレッド間で共有できないため、スレッド毎にコネクションを作成する
+        slice_size = -(-len(uid_list) // n_conn)
+        uid_slices = [uid_list[i:i + slice_size] for i in range(0, len(uid_list), slice_size)]
+        connections = []
+        try:
+            for _ in uid_slices:
+                connections.append(self.create_new_mail_server_connection())
+            msg_data_by_id = {}
+            with ThreadPoolExecutor(max_workers=len(connections)) as executor:
+                futures = [executor.submit(connection._fetch_msg_data, uid_slice, fetch_profile)
+                           for connection, uid_slice in zip(connections, uid_slices)]
+                for future in futures:
+                    msg_data_by_id.update(future.result())
+        finally:
+            for connection in connections:
+                connection.release()
+
+        # メールインスタンスは本コネクションに紐付けて生成する
+        return list(self._create_mails_from_msg_data(uid_list, msg_data_by_id, fetch_profile))
+
+    @classmethod
+    def acquire(cls, host: str, port: int, username: str, password: str, timeout: float = 10, mailbox: str = "INBOX",
+                fetch_batch_size: int = 100) -> "IMAPSSLConnection":
+        """IMAPメールサーバとの接続を取得する
+
+        同じホスト、ポート、ユーザ、パスワード、メールボックスへの返却済みの接続がある場合はそれを再利用し、ない場合は新しく接続する。
+        返却から一定時間経過した接続、NOOPに応答しない接続は切断し、新しく接続する。
+
+        Args:
+            host (str): IMAPサーバホスト名
+            port (int): IMAPサーバポート番号
+            username (str): IMAPサーバユーザ名
+            password (str): IMAPサーバパスワード
+            timeout (float, optional): 接続タイムアウト時間. Defaults to 10.
+            mailbox (str): 参照先メールボックス. Detaults to "INBOX"
+            fetch_batch_size (int, optional): 1回のFETCHで取得するメールの最大数. Defaults to 100.
+
+        Raises:
+            MailServerConnectException: IMAPサーバへの接続に失敗した場合
+
+        Returns:
+            IMAPSSLConnection: IMAPメールサーバとの接続
+        """
+        key = _connection_pool_key(host, port, username, password, mailbox)
+        while True:
+            # 直近に返却された接続から順に再利用する
+            with _CONNECTION_POOL_LOCK:
+                pooled = _CONNECTION_POOL.get(key)
+                connection = pooled.pop() if pooled else None
+            if connection is None:
                 break
-        return mails
+            if connection._is_reusable():
+                connection._fetch_batch_size = fetch_batch_size
+                return connection
+            connection.disconnect()
+
+        return cls(host=host, port=port, username=username, password=password, timeout=timeout, mailbox=mailbox,
+                   fetch_batch_size=fetch_batch_size)
 
     def create_new_mail_server_connection(self) -> "MailServerConnection":
         """新しいメールサーバコネクションを作成する
 
+        返却済みの接続がある場合はそれを再利用する。
+
         Returns:
             MailServerConnection: 新しいメールサーバコネクションインスタンス
         """
-        return self.__class__(
+        return self.acquire(
             host=self._host,
             port=self._port,
             username=self._username,
             password=self._password,
             timeout=self._timeout,
-            mailbox=self._mailbox
+            mailbox=self._mailbox,
+            fetch_batch_size=self._fetch_batch_size
         )
 
+    def release(self) -> None:
+        """メールサーバコネクションを再利用できるよう返却する
+
+        切断はせず接続のプールに保持する。同じ接続先の接続が既に_MAX_PARALLEL_CONNECTIONS個プールにある場合、
+        最も古く返却された接続を切断する。
+        返却したコネクションは以降使用しないこと。
+        """
+        self._released_at = time.monotonic()
+        with _CONNECTION_POOL_LOCK:
+            pooled = _CONNECTION_POOL.setdefault(self._pool_key(), [])
+            if self in pooled:
+                return
+            pooled.append(self)
+            evicted = pooled.pop(0) if len(pooled) > _MAX_PARALLEL_CONNECTIONS else None
+        if evicted is not None:
+            evicted.disconnect()
+
+    def _pool_key(self) -> tuple[str, int, str, str, str]:
+        """接続のプールのキーを取得する
+
+        Returns:
+            tuple[str, int, str, str, str]: ホスト名、ポート番号、ユーザ名、パスワードのハッシュ値、メールボックス
+        """
+        return _connection_pool_key(self._host, self._port, self._username, self._password, self._mailbox)
+
+    def _is_reusable(self) -> bool:
+        """返却済みの接続が再利用可能かの判定結果を返却する
+
+        Returns:
+            bool: True：再利用可能、False：再利用不可
+        """
+        # 多くのサーバは無通信の接続を約30分で切断するため、それより前に再接続する
+        if time.monotonic() - self._released_at > _POOL_IDLE_TIMEOUT_SEC:
+            return False
+        try:
+            status, _ = self.imap.noop()
+        except (imaplib.IMAP4.error, OSError):
+            return False
+        return status == "OK"
+
     def disconnect(self) -> None:
         """メールサーバコネクションを切断する
         """
@@ -208,43 +600,155 @@ class IMAPSSLConnection(MailServerConnection):
         except Exception:
             pass
 
-    def _search_all(self) -> list[bytes]:
+    def is_idle_supported(self) -> bool:
+        """メールサーバが新着メールの通知待ち（IDLE）に対応しているかの判定結果を返却する
+
+        Returns:
+            bool: True：対応している、False：対応していない
+        """
+        return self._idle_supported
+
+    def idle(self, timeout_sec: float) -> bool:
+        """メールサーバからの新着メールの通知を待機する（RFC 2177 IDLE）
+
+        サーバから何らかの応答を受けた場合、またはタイムアウト時間が経過した場合にDONEを送信して待機を終了する。
+
+        Args:
+            timeout_sec (float): 待機の最大秒数
+
+        Raises:
+            MailServerConnectException: IDLEの開始に失敗した場合
+
+        Returns:
+            bool: True：新着メール、メールの削除の通知（EXISTS、EXPUNGE）を受けた、False：通知を受けなかった
+        """
+        tag = self.imap._new_tag()
+        self.imap.send(tag + b" IDLE\r\n")
+
+        # 継続応答（+ idling）を待つ（継続応答より前に受けた応答も通知として扱う）
+        lines = []
+        while True:
+            line = self.imap._get_line()
+            if line.startswith(b"+"):
+                break
+            if line.startswith(tag):
+                raise MailServerConnectException(f"Fail to start IDLE. response={line}")
+            lines.append(line)
+
+        # サーバからの応答を待機する
+        # 応答を受けた時点で待機を終了することで、imaplibの読み込みバッファに応答が残ったまま待機し続けないようにする
+        if not lines:
+            readable = self.__has_received_data()
+            if not readable:
+                readable, _, _ = select.select([self.imap.sock], [], [], max(timeout_sec, 0))
+            if readable:
+                lines.append(self.imap._get_line())
+
+        # IDLEを終了し、完了応答までの応答を読み込む
+        self.imap.send(b"DONE\r\n")
+        while True:
+            line = self.imap._get_line()
+            if line.startswith(tag):
+                break
+            lines.append(line)
+
+        # メール数の参照に使用するため、imaplibが読み込んだ場合と同様にEXISTS、EXPUNGEを保持する
+        for line in lines:
+            matched = imaplib.Untagged_status.match(line.rstrip())
+            if matched and matched.group("type").upper() in _MAILBOX_CHANGE_RESPONSES:
+                self.imap._append_untagged(matched.group("type").upper().decode(), matched.group("data"))
+
+        return any(line.startswith(b"*") and line.rstrip().upper().endswith(_MAILBOX_CHANGE_RESPONSES) for line in lines)
+
+    def __has_received_data(self) -> bool:
+        """受信済みで未読み込みの応答があるかを判定する
+
+        継続応答と同時に受信した応答はimaplibの読み込みバッファやSSLの復号済みデータに格納されており、
+        ソケットのselectでは検知できないため、それらを待機せずに確認する。
+
+        Returns:
+            bool: True：未読み込みの応答がある、False：未読み込みの応答がない
+        """
+        sock = self.imap.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.pending() > 0:
+            return True
+        # 読み込みバッファが空の場合、peekはソケットから読み込むため、ノンブロッキングにして待機しないようにする
+        timeout = sock.gettimeout()
+        sock.settimeout(0)
+        try:
+            return len(self.imap.file.peek()) > 0
+        except (BlockingIOError, ssl.SSLWantReadError):
+            return False
+        finally:
+            sock.settimeout(timeout)
+
+    def _count_messages(self) -> int:
+        """メールボックスのメール数を取得する
+
+        Raises:
+            MailServerConnectException: メールボックスの状態取得に失敗した場合
+
+        Returns:
+            int: メール数
+        """
+        # 選択中のメールボックスへのSTATUSは禁止されているため（RFC 3501 6.3.10）、
+        # NOOPでメールボックスの変化を受け取り、imaplibが保持しているEXISTSの値を参照する
+        status, _ = self.imap.noop()
+        if status != "OK":
+            raise MailServerConnectException(
+                f"Fail to NOOP. mailbox={self._mailbox}, status={status}")
+        # EXPUNGEを受けた場合はEXISTSの値からメール数が減っているため、メールボックスを選択し直して最新の値を受け取る
+        if "EXPUNGE" in self.imap.untagged_responses:
+            self.__select_mailbox()
+        exists = self.imap.untagged_responses.get("EXISTS")
+        if not exists:
+            raise MailServerConnectException(
+                f"Fail to get message count. mailbox={self._mailbox}")
+        # 応答が蓄積し続けないよう、最新の値のみを残す
+        del exists[:-1]
+        return int(exists[-1])
+
+    def _search_all(self) -> list[int]:
         """メールボックスから全メールのUIDを取得する
 
         Raises:
             MailServerConnectException: メールボックスのメール検索に失敗した場合
 
         Returns:
-            list[bytes]: 全メールのUIDを取得する
+            list[int]: 全メールのUIDを取得する
         """
         return self._search("ALL")
 
-    def _search_unseen(self) -> list[bytes]:
+    def _search_unseen(self) -> list[int]:
         """メールボックスから全未読メールのUIDを取得する
 
         Raises:
             MailServerConnectException: メールボックスのメール検索に失敗した場合
 
         Returns:
-            list[bytes]: 全未読メールのUIDを取得する
+            list[int]: 全未読メールのUIDを取得する
         """
         return self._search("UNSEEN")
 
-    def _search_over_than_uid(self, uid: bytes) -> list[bytes]:
+    def _search_over_than_uid(self, uid: int) -> list[int]:
         """メールボックスから指定UIDよりも新しいメールのUIDを取得する
 
         Args:
-            uid (bytes): 基準UID
+            uid (int): 基準UID
 
         Raises:
             MailServerConnectException: メールボックスのメール検索に失敗した場合
 
         Returns:
-            list[bytes]: 指定UIDよりも新しいメールのUID一覧
+            list[int]: 指定UIDよりも新しいメールのUID一覧
         """
-        return self._search_by_uid(f"{int(uid)+1}:*")
+        uid_list = self._search(f"UID {uid + 1}:*")
+        if uid_list is None:
+            return None
+        # "n:*"は指定UIDより新しいメールがない場合も最新のメールに合致するため除外する
+        return [found_uid for found_uid in uid_list if found_uid > uid] or None
 
-    def _search(self, criterion: str) -> list[bytes]:
+    def _search(self, criterion: str) -> list[int]:
         """メールボックスから指定のメールのUIDを取得する
 
         Args:
@@ -254,11 +758,12 @@ class IMAPSSLConnection(MailServerConnection):
             MailServerConnectException: メールボックスのメール検索に失敗した場合
 
         Returns:
-            list[bytes]: 検索条件に合致したメールのUID一覧
+            list[int]: 検索条件に合致したメールのUID一覧
         """
         # 指定の基準でメールを検索
-        # msg_numsはlist、要素[0]にはb'1 2 3 4 5 6 7 8...'が格納されている
-        status, uid_list = self.imap.search(None, criterion)
+        # メッセージ番号はメールの削除により変化するため、UIDで検索する
+        # uid_listはlist、要素[0]にはb'1 2 3 4 5 6 7 8...'が格納されている
+        status, uid_list = self.imap.uid('search', None, criterion)
         if status != "OK":
             raise MailServerConnectException(
                 f"Fail to Mail Search. criterion={criterion}, status={status}")
@@ -267,73 +772,584 @@ class IMAPSSLConnection(MailServerConnection):
         if not uid_list[0]:
             return None
 
-        # スペース区切りでスプリット
-        return uid_list[0].split()
+        # スペース区切りでスプリットし、数値に変換
+        return _parse_uids(uid_list[0])
 
-    def _search_by_uid(self, criterion: str) -> list[bytes]:
-        """メールボックスから指定UIDのメールを取得する
+    def _fetch_many(self, uid_list: list[int], fetch_profile: FetchProfile = FetchProfile.FULL):
+        """UID一覧を元にメールボックスからメール情報をロードし、メールインスタンスとして順次返却する
+
+        サーバのリクエストサイズ上限を超えないよう、fetch_batch_size毎に分割してFETCHを実施する。
+        分割したFETCHは応答を待たずに連続で送信し、サーバの処理待ち時間を重ね合わせる。
+        UIDに該当するメールデータが存在しない場合、その直前のUIDまでのメールを返却する。
 
         Args:
-            criterion (str): 検索条件
+            uid_list (list[int]): ロード対象のメールのUID一覧
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
 
         Raises:
-            MailServerConnectException: メールボックスのメール検索に失敗した場合
+            MailLoadException: メール読み込みに失敗した場合
+
+        Yields:
+            Mail: メールインスタンス（引数のUID一覧の順序を保持する）
+        """
+        yield from self._create_mails_from_msg_data(
+            uid_list, self._fetch_msg_data(uid_list, fetch_profile), fetch_profile)
+
+    def _fetch_msg_data(self, uid_list: list[int], fetch_profile: FetchProfile = FetchProfile.FULL) -> dict[int, list]:
+        """UID一覧を元にメールボックスからメール情報をロードする
+
+        サーバのリクエストサイズ上限を超えないよう、fetch_batch_size毎に分割してFETCHを実施する。
+        分割したFETCHは応答を待たずに連続で送信し、サーバの処理待ち時間を重ね合わせる。
+
+        Args:
+            uid_list (list[int]): ロード対象のメールのUID一覧
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
+
+        Raises:
+            MailLoadException: メール読み込みに失敗した場合
 
         Returns:
-            list[bytes]: 検索条件に合致したメールのUID一覧
+            dict[int, list]: UIDをキーとしたメール情報
         """
-        # 指定の基準でメールを検索
-        # msg_numsはlist、要素[0]にはb'1 2 3 4 5 6 7 8...'が格納されている
-        status, uid_list = self.imap.uid('search', None, "UID", criterion)
-        if status != "OK":
-            raise MailServerConnectException(
-                f"Fail to Mail Search by UID. criterion={criterion}, status={status}")
+        use_cache = fetch_profile is not FetchProfile.FULL and self._uidvalidity is not None
+        msg_data_by_id = self.__get_cached_headers(uid_list, fetch_profile) if use_cache else {}
+        missing_uid_list = [uid for uid in uid_list if uid not in msg_data_by_id]
+        if missing_uid_list:
+            message_sets = [_to_message_set(chunk) for chunk in batched(missing_uid_list, self._fetch_batch_size)]
+            data = self._pipelined_fetch(message_sets, fetch_profile.value)
+            fetched_msg_data_by_id = self._split_fetch_response(data)
+            if use_cache:
+                self.__put_cached_headers(fetched_msg_data_by_id, fetch_profile)
+            msg_data_by_id.update(fetched_msg_data_by_id)
+        return msg_data_by_id
+
+    def __header_cache_key(self, uid: int, fetch_profile: FetchProfile) -> tuple:
+        """ヘッダ情報のキャッシュのキーを返却する
 
-        # メールがない場合、Noneを返却
-        if not uid_list[0]:
-            return None
+        Args:
+            uid (int): メールUID
+            fetch_profile (FetchProfile): メール情報の取得項目
+
+        Returns:
+            tuple: キャッシュのキー
+        """
+        return (self._host, self._username, self._mailbox, self._uidvalidity, uid, fetch_profile)
+
+    def __get_cached_headers(self, uid_list: list[int], fetch_profile: FetchProfile) -> dict[int, list]:
+        """UID一覧のうちキャッシュ済みのヘッダ情報を返却する
+
+        Args:
+            uid_list (list[int]): ロード対象のメールのUID一覧
+            fetch_profile (FetchProfile): メール情報の取得項目
+
+        Returns:
+            dict[int, list]: UIDをキーとしたキャッシュ済みのメール情報
+        """
+        cached_msg_data_by_id = {}
+        with _HEADER_CACHE_LOCK:
+            for uid in uid_list:
+                key = self.__header_cache_key(uid, fetch_profile)
+                msg_data = _HEADER_CACHE.get(key)
+                if msg_data is not None:
+                    _HEADER_CACHE.move_to_end(key)
+                    cached_msg_data_by_id[uid] = msg_data
+        return cached_msg_data_by_id
+
+    def __put_cached_headers(self, msg_data_by_id: dict[int, list], fetch_profile: FetchProfile):
+        """ロードしたヘッダ情報をキャッシュに格納する
+
+        最大件数を超えた場合は最も古く参照されたものから破棄する。
+
+        Args:
+            msg_data_by_id (dict[int, list]): UIDをキーとしたメール情報
+            fetch_profile (FetchProfile): メール情報の取得項目
+        """
+        with _HEADER_CACHE_LOCK:
+            for uid, msg_data in msg_data_by_id.items():
+                key = self.__header_cache_key(uid, fetch_profile)
+                _HEADER_CACHE[key] = msg_data
+                _HEADER_CACHE.move_to_end(key)
+            while len(_HEADER_CACHE) > _HEADER_CACHE_MAXSIZE:
+                _HEADER_CACHE.popitem(last=False)
+
+    def _create_mails_from_msg_data(self, uid_list: list[int], msg_data_by_id: dict[int, list],
+                                    fetch_profile: FetchProfile = FetchProfile.FULL):
+        """ロードしたメール情報からメールインスタンスを生成し、UID一覧の順に返却する
+
+        UIDに該当するメールデータが存在しない場合、その直前のUIDまでのメールを返却する。
+
+        Args:
+            uid_list (list[int]): ロード対象のメールのUID一覧
+            msg_data_by_id (dict[int, list]): UIDをキーとしたメール情報
+            fetch_profile (FetchProfile, optional): ロードしたメール情報の取得項目. Defaults to FetchProfile.FULL.
+
+        Yields:
+            Mail: メールインスタンス
+        """
+        # Gmailの場合、最新のメールUID+1を指定してfetchした場合、statusはOKとなりmsg_dataは空になることが判明したため
+        # 該当するメールデータが存在しないUIDに到達した時点で終了する
+        for uid in uid_list:
+            msg_data = msg_data_by_id.get(uid)
+            if msg_data is None:
+                return
+            yield self._create_lmap_mail_instalce(
+                uid=uid, msg_data=msg_data, headers_only=fetch_profile is not FetchProfile.FULL)
 
-        # スペース区切りでスプリット
-        return uid_list[0].split()
+    def _pipelined_fetch(self, message_sets: list[bytes], message_parts: str, by_uid: bool = True) -> list:
+        """複数のFETCHを応答を待たずに連続で送信し、全FETCHの応答をまとめて返却する
 
-    def __load_mail_by_uid(self, uid: bytes) -> Mail:
-        """UIDを元にメールボックスからメール情報をロードし、メールインスタンスとして返却するｊ
+        各FETCHの完了応答はタグを元にimaplibが振り分けるため、送信順に完了を待つ。
 
         Args:
-            uid (bytes): ロード対象のメールのUID
+            message_sets (list[bytes]): FETCH毎の対象メッセージセット
+            message_parts (str): 取得項目
+            by_uid (bool, optional): メッセージセットがUIDか（UID FETCHを使用するか）. Defaults to True.
+                Falseの場合、メッセージセットはメッセージ番号とする
 
         Raises:
             MailLoadException: メール読み込みに失敗した場合
 
         Returns:
-            Mail: メールインスタンス
+            list: 全FETCHの応答
         """
-        status, msg_data = self.imap.fetch(uid, "(RFC822 INTERNALDATE)")
-        if status != "OK":
+        command, command_args = ("UID", ("FETCH",)) if by_uid else ("FETCH", ())
+        tags = [self.imap._command(command, *command_args, message_set, message_parts) for message_set in message_sets]
+        # 一部のFETCHが失敗した場合も、後続の応答を読み残さないよう全ての完了を待つ
+        # imaplibはBAD応答を受けた時点で例外を送出するため、失敗を記録して残りの完了を待つ
+        failures = []
+        for message_set, tag in zip(message_sets, tags):
+            try:
+                status, _ = self.imap._command_complete(command, tag)
+            except imaplib.IMAP4.abort as e:
+                # 接続が切断された場合は残りの応答を待てないため、その時点で終了する
+                self.imap.untagged_responses.pop("FETCH", None)
+                raise MailLoadException(f"Fail to load Mail. message_set={message_set}", e)
+            except imaplib.IMAP4.error as e:
+                failures.append((message_set, "BAD", e))
+                continue
+            if status != "OK":
+                failures.append((message_set, status, None))
+        data = self.imap.untagged_responses.pop("FETCH", [None])
+        if failures:
+            message_set, status, error = failures[0]
             raise MailLoadException(
-                f"Fail to load Mail. status={status}, uid={uid}")
-        # UIDに該当するメールデータが存在しない場合、例外を送出
-        # Gmailの場合、最新のメールUID+1を指定してfetchした場合、statusはOKとなりmsg_dataは空になることが判明したため
-        # そのための考慮。
-        if not msg_data or msg_data[0] is None:
-            raise MailMessageDataNotFoundException(
-                f"Mail Message Data Not Found. uid={uid}")
-        return self._create_lmap_mail_instalce(uid=uid, msg_data=msg_data)
+                f"Fail to load Mail. status={status}, message_set={message_set}", error)
+        return data
+
+    def _split_fetch_response(self, data: list) -> dict[int, list]:
+        """FETCHの応答をメール毎のメール情報に分割する
+
+        FETCHの応答は以下のようにメール毎の要素が連続して格納されている。
+        （リテラルを含む要素はタプル、それ以外はbytes）
 
-    def _create_lmap_mail_instalce(self, uid: bytes, msg_data) -> IMAPMail:
+            [(b'1 (UID 1 INTERNALDATE "..." BODY[] {size}', b'...'), b')', (b'2 (UID 2 INTERNALDATE "..." BODY[] {size}', b'...'), ...]
+
+        Args:
+            data (list): FETCHの応答
+
+        Returns:
+            dict[int, list]: UIDをキーとしたメール情報
+        """
+        msg_data_list = []
+        msg_data = None
+        for item in data:
+            if item is None:
+                continue
+            if isinstance(item, tuple) and _FETCH_ID_RE.match(item[0]) is not None:
+                # 新しいメールの開始
+                msg_data = [item]
+                msg_data_list.append(msg_data)
+                continue
+            if msg_data is not None:
+                msg_data.append(item)
+        return {_find_fetch_uid(msg_data): msg_data for msg_data in msg_data_list}
+
+    def _create_lmap_mail_instalce(self, uid: int, msg_data, headers_only: bool = False) -> IMAPMail:
         """メールインスタンスを生成して返却
 
         引数にしていられたUID、ロードしたメール情報からメールインスタンスを生成し返却
 
         Args:
-            uid (bytes): メールUID
+            uid (int): メールUID
             msg_data: ロードしたメール情報
+            headers_only (bool, optional): ロードしたメール情報がヘッダ部のみか. Defaults to False.
+                Trueの場合、本文は参照された時点で本コネクションからロードする
 
         Returns:
             IMAPMail: メールインスタンス
         """
+        if headers_only:
+            return IMAPMail(uid=uid, msg_data=msg_data, mailserveronnection=self, body_loader=self._load_full_msg_data)
         return IMAPMail(uid=uid, msg_data=msg_data, mailserveronnection=self)
 
+    def _load_full_msg_data(self, uid: int) -> list:
+        """UIDを元にメールボックスからメール全体のメール情報をロードする
+
+        Args:
+            uid (int): ロード対象のメールのUID
+
+        Raises:
+            MailLoadException: メール読み込みに失敗した場合
+            MailMessageDataNotFoundException: UIDに該当するメールデータが存在しない場合
+
+        Returns:
+            list: メール全体のメール情報
+        """
+        msg_data = self._fetch_msg_data([uid], FetchProfile.FULL).get(uid)
+        if msg_data is None:
+            raise MailMessageDataNotFoundException(
+                f"Mail Message Data Not Found. uid={uid}")
+        return msg_data
+
+
+class AsyncIMAPSSLConnection(MailServerConnection):
+    """asyncioによるIMAPサーバ（SSL）との接続を表すクラス
+
+    aioimaplibを使用し、メールサーバとの通信を伴うメソッドはコルーチンとして実行する。
+    一つのイベントループ上で複数のコネクション（複数のアカウント、メールボックス）の処理を並行して実行できる。
+
+    Attributes:
+        imap (aioimaplib.IMAP4_SSL): IMAP接続インスタンス
+    """
+
+    def __init__(self, host: str, port: int, username: str, password: str, timeout: float = 10, mailbox: str = "INBOX",
+                 fetch_batch_size: int = 100):
+        """コンストラクタ
+
+        引数に指定されたIMAPサーバ接続情報を保持する。IMAP接続はconnectを実行した時点で実施する。
+
+        Args:
+            host (str): IMAPサーバホスト名
+            port (int): IMAPサーバポート番号
+            username (str): IMAPサーバユーザ名
+            password (str): IMAPサーバパスワード
+            timeout (float, optional): 接続タイムアウト時間. Defaults to 10.
+            mailbox (str): 参照先メールボックス. Detaults to "INBOX"
+            fetch_batch_size (int, optional): 1回のFETCHで取得するメールの最大数. Defaults to 100.
+
+        Raises:
+            MailServerConnectException: aioimaplibがインストールされていない場合
+        """
+        if aioimaplib is None:
+            raise MailServerConnectException("aioimaplib is not installed. Install dpymail[async].")
+        self._host = host
+        self._port = port
+        self._username = username
+        self._password = password
+        self._timeout = timeout
+        self._mailbox = mailbox
+        self._fetch_batch_size = fetch_batch_size
+        self._idle_supported = False
+        self.imap = None
+
+    async def connect(self) -> "AsyncIMAPSSLConnection":
+        """IMAPサーバへの接続、ログイン、メールボックスの選択を実施する
+
+        Raises:
+            MailServerConnectException: IMAPサーバへの接続に失敗した場合
+
+        Returns:
+            AsyncIMAPSSLConnection: 接続したメールサーバコネクション
+        """
+        try:
+            self.imap = aioimaplib.IMAP4_SSL(host=self._host, port=self._port, timeout=self._timeout)
+            await self.imap.wait_hello_from_server()
+        except (OSError, asyncio.TimeoutError) as e:
+            raise MailServerConnectException(
+                f"Fail to Access Server. host={self._host}, port={self._port}, timeout={self._timeout}", e)
+        response = await self.imap.login(self._username, self._password)
+        if response.result != "OK":
+            raise MailServerConnectException(
+                f"Fail to Login. username={self._username}, password=**********")
+        await self.imap.select(self._mailbox)
+        self._idle_supported = self.imap.has_capability("IDLE")
+        return self
+
+    async def create_checkpoint(self) -> "AsyncMailCheckPoint":
+        """メールサーバのチェックポイントを作成する
+
+        Returns:
+            AsyncMailCheckPoint: チェックポイントインスタンス
+        """
+        lastest_mail = await self.lastest_mail()
+        return AsyncMailCheckPoint(self, lastest_mail)
+
+    async def lastest_mail(self, fetch_profile: FetchProfile = FetchProfile.HEADERS_ONLY) -> Mail:
+        """メールボックスから最も新しいメールを取得する
+
+        メールが存在しない場合Noneを返却する。
+
+        Args:
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.HEADERS_ONLY.
+                FetchProfile.FULL以外の場合、本文は取得しない
+
+        Returns:
+            Mail: 最も新しいメール
+        """
+        lastestmail = await self.lastest_mail_by_count(1, fetch_profile)
+        if lastestmail:
+            return lastestmail[0]
+        else:
+            return None
+
+    async def lastest_mail_by_count(self, getmailcount: int, fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
+        """メールボックスから最も新しいメールを指定された数取得する
+
+        メールが存在しない場合空のリストを返却する。
+
+        Args:
+            getmailcount (int): 取得対象のメール数
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
+                FetchProfile.FULL以外の場合、本文は取得しない
+
+        Returns:
+            list[Mail]: 最も新しいメール一覧
+        """
+        uid_list = await self._search("ALL", tail_count=getmailcount)
+        if uid_list is None:
+            return []
+        return await self._fetch_many(uid_list, fetch_profile)
+
+    async def lastest_mail_over_than_arg_mail(self, mail: Mail, fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
+        """メールボックスから指定されたメールよりも新しいメールを取得する
+
+        メールが存在しない場合空のリストを返却する。
+
+        Args:
+            mail (Mail): 基準メール
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
+                FetchProfile.FULL以外の場合、本文は取得しない
+
+        Returns:
+            list[Mail]: 指定されたメールよりも新しいメール一覧
+        """
+        uid_list = await self._search(f"UID {mail._uid + 1}:*")
+        if uid_list is None:
+            return []
+        # "n:*"は指定UIDより新しいメールがない場合も最新のメールに合致するため除外する
+        uid_list = [uid for uid in uid_list if uid > mail._uid]
+        return await self._fetch_many(uid_list, fetch_profile)
+
+    async def create_new_mail_server_connection(self) -> "AsyncIMAPSSLConnection":
+        """新しいメールサーバコネクションを作成する
+
+        Returns:
+            AsyncIMAPSSLConnection: 新しいメールサーバコネクションインスタンス
+        """
+        connection = AsyncIMAPSSLConnection(
+            self._host, self._port, self._username, self._password, self._timeout, self._mailbox, self._fetch_batch_size)
+        return await connection.connect()
+
+    async def disconnect(self) -> None:
+        """メールサーバコネクションを切断する
+        """
+        try:
+            await self.imap.close()
+            await self.imap.logout()
+        except Exception:
+            pass
+
+    async def release(self) -> None:
+        """メールサーバコネクションを返却する
+
+        接続のプールは行わないため、切断する。
+        """
+        await self.disconnect()
+
+    def is_idle_supported(self) -> bool:
+        """メールサーバが新着メールの通知待ち（IDLE）に対応しているかの判定結果を返却する
+
+        Returns:
+            bool: True：対応している、False：対応していない
+        """
+        return self._idle_supported
+
+    async def idle(self, timeout_sec: float) -> bool:
+        """メールサーバからの新着メールの通知を待機する（RFC 2177 IDLE）
+
+        サーバから何らかの応答を受けた場合、またはタイムアウト時間が経過した場合にDONEを送信して待機を終了する。
+
+        Args:
+            timeout_sec (float): 待機の最大秒数
+
+        Returns:
+            bool: True：新着メール、メールの削除の通知（EXISTS、EXPUNGE）を受けた、False：通知を受けなかった
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(timeout_sec, 0)
+        # 前回のIDLEの終了後に格納された通知を破棄する
+        # （aioimaplibはタイムアウト時に待機終了指示（STOP_WAIT_SERVER_PUSH）を格納するため、残っていると直ちに待機を終えてしまう）
+        idle_queue = self.imap.protocol.idle_queue
+        while not idle_queue.empty():
+            idle_queue.get_nowait()
+        idle = await self.imap.idle_start(timeout=max(timeout_sec, 0))
+        lines = []
+        try:
+            while (remaining_sec := deadline - loop.time()) > 0:
+                pushed = await self.imap.wait_server_push(timeout=remaining_sec)
+                # 待機終了指示の場合は、待機の期限まで通知の待機を続ける
+                if pushed == aioimaplib.STOP_WAIT_SERVER_PUSH:
+                    continue
+                if isinstance(pushed, list):
+                    lines.extend(pushed)
+                break
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.imap.idle_done()
+            response = await asyncio.wait_for(idle, self._timeout)
+        lines.extend(response.lines)
+
+        return any(isinstance(line, bytes) and line.rstrip().upper().endswith(_MAILBOX_CHANGE_RESPONSES) for line in lines)
+
+    async def _search(self, criterion: str, tail_count: int = None) -> list[int]:
+        """メールボックスから指定のメールのUIDを取得する
+
+        Args:
+            criterion (str): 検索条件
+            tail_count (int, optional): 検索結果の末尾から取得するUIDの数. Defaults to None（全件）.
+
+        Raises:
+            MailServerConnectException: メールボックスのメール検索に失敗した場合
+
+        Returns:
+            list[int]: 検索条件に合致したメールのUID一覧
+        """
+        # 応答の要素[0]にはb'1 2 3 4 5 6 7 8...'が格納されている
+        response = await self.imap.uid_search(criterion, charset=None)
+        if response.result != "OK":
+            raise MailServerConnectException(
+                f"Fail to search mail. criterion={criterion}")
+        if not response.lines or not response.lines[0].strip():
+            return None
+        return _parse_uids(response.lines[0], tail_count)
+
+    async def load_mail_body(self, mail: IMAPMail) -> IMAPMail:
+        """ヘッダ部のみをロードしたメールに、メール全体のメール情報をロードする
+
+        FetchProfile.FULL以外で取得したメールは本文を保持していないため、
+        本文、バイナリデータを参照する前に本メソッドでロードする必要がある。
+        （非同期のコネクションでは参照時に自動でロードできないため）
+
+        Args:
+            mail (IMAPMail): ロード対象のメール
+
+        Raises:
+            MailLoadException: メール読み込みに失敗した場合
+            MailMessageDataNotFoundException: UIDに該当するメールデータが存在しない場合
+
+        Returns:
+            IMAPMail: メール全体のメール情報をロードしたメール（引数のメールと同一のインスタンス）
+        """
+        msg_data = (await self._fetch_msg_data([mail._uid], FetchProfile.FULL)).get(mail._uid)
+        if msg_data is None:
+            raise MailMessageDataNotFoundException(
+                f"Mail Message Data Not Found. uid={mail._uid}")
+        # IMAPMail._full_msg_dataはcached_propertyのため、ロード結果を設定すると以降はその値が参照される
+        mail._full_msg_data = msg_data
+        return mail
+
+    async def _fetch_many(self, uid_list: list[int], fetch_profile: FetchProfile = FetchProfile.FULL) -> list[Mail]:
+        """UID一覧を元にメールボックスからメール情報をロードし、メールインスタンスとして返却する
+
+        UIDに該当するメールデータが存在しない場合、その直前のUIDまでのメールを返却する。
+        FetchProfile.FULL以外の場合、本文はload_mail_body()でロードするまで参照できない。
+
+        Args:
+            uid_list (list[int]): ロード対象のメールのUID一覧
+            fetch_profile (FetchProfile, optional): メール情報の取得項目. Defaults to FetchProfile.FULL.
+
+        Raises:
+            MailLoadException: メール読み込みに失敗した場合
+
+        Returns:
+            list[Mail]: メールインスタンス一覧（引数のUID一覧の順序を保持する）
+        """
+        msg_data_by_uid = await self._fetch_msg_data(uid_list, fetch_profile)
+
+        mails = []
+        for uid in uid_list:
+            msg_data = msg_data_by_uid.get(uid)
+            if msg_data is None:
+                break
+            if fetch_profile is FetchProfile.FULL:
+                mails.append(IMAPMail(uid=uid, msg_data=msg_data, mailserveronnection=self))
+            else:
+                mails.append(IMAPMail(uid=uid, msg_data=msg_data, mailserveronnection=self,
+                                      body_loader=self.__raise_body_not_loaded))
+        return mails
+
+    async def _fetch_msg_data(self, uid_list: list[int], fetch_profile: FetchProfile) -> dict[int, list]:
+        """UID一覧を元にメールボックスからメール情報をロードする
+
+        サーバのリクエストサイズ上限を超えないよう、fetch_batch_size毎に分割してFETCHを実施する。
+        aioimaplibは同一コネクション上の同名のコマンドを並行して実行できないため、分割したFETCHは順に実行する。
+
+        Args:
+            uid_list (list[int]): ロード対象のメールのUID一覧
+            fetch_profile (FetchProfile): メール情報の取得項目
+
+        Raises:
+            MailLoadException: メール読み込みに失敗した場合
+
+        Returns:
+            dict[int, list]: UIDをキーとしたメール情報
+        """
+        msg_data_by_uid = {}
+        for chunk in batched(uid_list, self._fetch_batch_size):
+            response = await self.imap.uid("fetch", _to_message_set(chunk).decode(), fetch_profile.value)
+            if response.result != "OK":
+                raise MailLoadException(
+                    f"Fail to load mail. uid_list={uid_list}")
+            msg_data_by_uid.update(self._split_fetch_response(response.lines))
+        return msg_data_by_uid
+
+    def __raise_body_not_loaded(self, uid: int) -> list:
+        """ヘッダ部のみをロードしたメールの本文が参照された場合に例外を送出する
+
+        非同期のコネクションでは参照時にメール全体をロードできないため、
+        ヘッダ部のみの本文を返却せずに例外とする。
+
+        Args:
+            uid (int): 参照されたメールのUID
+
+        Raises:
+            MailLoadException: 常に送出する
+        """
+        raise MailLoadException(
+            f"Mail body is not loaded. Call load_mail_body() before reading it. uid={uid}")
+
+    def _split_fetch_response(self, lines: list) -> dict[int, list]:
+        """aioimaplibのFETCHの応答をimaplibと同じ形式のメール毎のメール情報に分割する
+
+        aioimaplibのFETCHの応答は以下のようにリテラルが独立した要素として格納されている。
+
+            [b'1 FETCH (UID 1 INTERNALDATE "..." BODY[] {size}', bytearray(b'...'), b')', ..., b'FETCH completed.']
+
+        Args:
+            lines (list): FETCHの応答
+
+        Returns:
+            dict[int, list]: UIDをキーとしたメール情報
+        """
+        msg_data_list = []
+        msg_data = None
+        # 末尾の要素は完了応答のため除外する
+        for index, line in enumerate(lines[:-1]):
+            if isinstance(line, bytearray):
+                continue
+            if isinstance(lines[index + 1], bytearray):
+                item = (line.replace(b" FETCH ", b" ", 1), bytes(lines[index + 1]))
+                if _FETCH_ID_RE.match(item[0]) is not None:
+                    # 新しいメールの開始
+                    msg_data = [item]
+                    msg_data_list.append(msg_data)
+                    continue
+                line = item
+            if msg_data is not None:
+                msg_data.append(line)
+        return {_find_fetch_uid(msg_data): msg_data for msg_data in msg_data_list}
+
 
 class MailCheckPoint:
     """メールサーバのチェックポイントを表すクラス
@@ -350,6 +1366,10 @@ class MailCheckPoint:
         """
         self._mailserverconnection = mailserverconnection
         self._checkpoint_mail = checkpoint_mail
+        # 直近のチェックポイントメールよりも新しいメールの取得結果
+        self._cached_mails = None
+        self._cached_mails_key = None
+        self._cached_mails_at = 0.0
 
     def get_checkpoint_mail(self) -> Mail:
         """チェックポイントメールを取得する
@@ -367,15 +1387,65 @@ class MailCheckPoint:
         """
         return self._mailserverconnection
 
-    def get_mails_over_than_checkpoint(self) -> list[Mail]:
+    def get_mails_over_than_checkpoint(self, cache_ttl_sec: float = 0) -> list[Mail]:
         """チェックポイントメールよりも新しいメールを取得する
 
         チェックポイントより新しいメールが存在しない場合、空のリストを返却する。
+        ヘッダ部のみを取得するため、取得済みのメールはヘッダ情報のキャッシュから再利用される。
+        本文は参照された時点でメールサーバからロードする。
+
+        Args:
+            cache_ttl_sec (float, optional): 直近の取得結果を再利用する秒数. Defaults to 0（再利用しない）.
+                同一のコネクション、チェックポイントメールでの取得結果が指定秒数以内の場合、メールサーバに問い合わせない
 
         Returns:
             list[Mail]: チェックポイントメールよりも新しいメール一覧
         """
-        return self._mailserverconnection.lastest_mail_over_than_arg_mail(self._checkpoint_mail)
+        mails = self._get_cached_mails(cache_ttl_sec)
+        if mails is None:
+            mails = self._mailserverconnection.lastest_mail_over_than_arg_mail(
+                self._checkpoint_mail, FetchProfile.HEADERS_ONLY)
+            self._cache_mails(mails)
+        return mails
+
+    def _get_cached_mails(self, cache_ttl_sec: float) -> list[Mail]:
+        """直近の取得結果が再利用できる場合、その取得結果を返却する
+
+        Args:
+            cache_ttl_sec (float): 直近の取得結果を再利用する秒数
+
+        Returns:
+            list[Mail]: 直近の取得結果（再利用できない場合None）
+        """
+        if cache_ttl_sec <= 0 or self._cached_mails_key != self.__cache_key():
+            return None
+        if time.monotonic() - self._cached_mails_at >= cache_ttl_sec:
+            return None
+        return self._cached_mails
+
+    def _cache_mails(self, mails: list[Mail]) -> None:
+        """取得結果を保持する
+
+        Args:
+            mails (list[Mail]): チェックポイントメールよりも新しいメール一覧
+        """
+        self._cached_mails = mails
+        self._cached_mails_key = self.__cache_key()
+        self._cached_mails_at = time.monotonic()
+
+    def _invalidate_cached_mails(self) -> None:
+        """保持している取得結果を破棄する
+        """
+        self._cached_mails = None
+        self._cached_mails_key = None
+
+    def __cache_key(self) -> tuple[int, int]:
+        """取得結果を再利用できるかの判定に使用するキーを返却する
+
+        Returns:
+            tuple[int, int]: コネクションの識別子、チェックポイントメールのUID
+        """
+        return (id(self._mailserverconnection), getattr(self._checkpoint_mail, "_uid", None))
 
     def monitoring_new_mails(self, func, interval_sec: int, timeout_sec: int) -> None:
         """チェックポイントメールよりも新しいメールが到着した場合にコールバック関数を実行する
@@ -388,15 +1458,20 @@ class MailCheckPoint:
         Raises:
             MonitoringTimeoutException: 監視がタイムアウトした場合
         """
-        import time
-
         start_time = time.time()
+        # IDLEで待機する場合、確認間隔の半分の間は直近の取得結果を再利用する（メールボックスの変化を通知された場合は破棄する）
+        # IDLEに対応していない場合は確認の度にコネクションを作成し直して最新の状態を参照するため、再利用しない
+        cache_ttl_sec = interval_sec / 2
         while True:
-            old_connection = self._mailserverconnection
-            self._mailserverconnection = old_connection.create_new_mail_server_connection()
-            old_connection.disconnect()
-
-            new_mails = self.get_mails_over_than_checkpoint()
+            # IDLEに対応していない場合は、最新のメールボックスの状態を参照するためコネクションを作成し直す
+            if not self._mailserverconnection.is_idle_supported():
+                old_connection = self._mailserverconnection
+                old_connection.release()
+                self._mailserverconnection = old_connection.create_new_mail_server_connection()
+
+            # 新着メール、メールの削除の通知を受けずにIDLEを早く終えた場合は、直近の取得結果を再利用する
+            new_mails = self.get_mails_over_than_checkpoint(
+                cache_ttl_sec if self._mailserverconnection.is_idle_supported() else 0)
             if new_mails:
                 is_fin = func(new_mails)
                 # コールバック関数よりの終了指示があった場合、監視を終了
@@ -411,4 +1486,79 @@ class MailCheckPoint:
                 raise MailMonitoringTimeoutException(
                     f"Mail Monitoring Timeout. timeout_sec={timeout_sec}")
 
-            time.sleep(interval_sec)
+            # IDLEに対応している場合は新着メールの通知を待機し、対応していない場合は一定時間待機する
+            if self._mailserverconnection.is_idle_supported():
+                if self._mailserverconnection.idle(min(interval_sec, timeout_sec - elapsed_time)):
+                    self._invalidate_cached_mails()
+            else:
+                time.sleep(interval_sec)
+
+
+class AsyncMailCheckPoint(MailCheckPoint):
+    """非同期のメールサーバコネクションのチェックポイントを表すクラス
+    """
+
+    async def get_mails_over_than_checkpoint(self, cache_ttl_sec: float = 0) -> list[Mail]:
+        """チェックポイントメールよりも新しいメールを取得する
+
+        チェックポイントより新しいメールが存在しない場合、空のリストを返却する。
+        非同期のコネクションは本文を参照時にロードできないため、メール全体を取得する（ヘッダ情報のキャッシュは使用しない）。
+
+        Args:
+            cache_ttl_sec (float, optional): 直近の取得結果を再利用する秒数. Defaults to 0（再利用しない）.
+                同一のコネクション、チェックポイントメールでの取得結果が指定秒数以内の場合、メールサーバに問い合わせない
+
+        Returns:
+            list[Mail]: チェックポイントメールよりも新しいメール一覧
+        """
+        mails = self._get_cached_mails(cache_ttl_sec)
+        if mails is None:
+            mails = await self._mailserverconnection.lastest_mail_over_than_arg_mail(self._checkpoint_mail)
+            self._cache_mails(mails)
+        return mails
+
+    async def monitoring_new_mails(self, func, interval_sec: int, timeout_sec: int) -> None:
+        """チェックポイントメールよりも新しいメールが到着した場合にコールバック関数を実行する
+
+        待機中はイベントループを占有しないため、複数のチェックポイントを並行して監視できる。
+
+        Args:
+            func (function): 新しいメールが到着した場合に実行するコールバック関数
+            interval_sec (int): 新しいメール到着確認間隔秒数
+            timeout_sec (int): タイムアウト秒数
+
+        Raises:
+            MonitoringTimeoutException: 監視がタイムアウトした場合
+        """
+        start_time = time.time()
+        # IDLEで待機する場合、確認間隔の半分の間は直近の取得結果を再利用する（メールボックスの変化を通知された場合は破棄する）
+        # IDLEに対応していない場合は確認の度にコネクションを作成し直して最新の状態を参照するため、再利用しない
+        cache_ttl_sec = interval_sec / 2
+        while True:
+            # IDLEに対応していない場合は、最新のメールボックスの状態を参照するためコネクションを作成し直す
+            if not self._mailserverconnection.is_idle_supported():
+                old_connection = self._mailserverconnection
+                await old_connection.release()
+                self._mailserverconnection = await old_connection.create_new_mail_server_connection()
+
+            # 新着メール、メールの削除の通知を受けずにIDLEを早く終えた場合は、直近の取得結果を再利用する
+            new_mails = await self.get_mails_over_than_checkpoint(
+                cache_ttl_sec if self._mailserverconnection.is_idle_supported() else 0)
+            if new_mails:
+                is_fin = func(new_mails)
+                # コールバック関数よりの終了指示があった場合、監視を終了
+                if is_fin:
+                    break
+
+            # タイムアウト判定
+            elapsed_time = time.time() - start_time
+            if elapsed_time >= timeout_sec:
+                raise MailMonitoringTimeoutException(
+                    f"Mail Monitoring Timeout. timeout_sec={timeout_sec}")
+
+            # IDLEに対応している場合は新着メールの通知を待機し、対応していない場合は一定時間待機する
+            if self._mailserverconnection.is_idle_supported():
+                if await self._mailserverconnection.idle(min(interval_sec, timeout_sec - elapsed_time)):
+                    self._invalidate_cached_mails()
+            else:
+                await asyncio.sleep(interval_sec)
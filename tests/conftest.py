@@ -0,0 +1,24 @@
+import os
+import sys
+
+# パッケージ内のモジュールはフラットにimportしているため、パッケージディレクトリを参照パスに追加する
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "dpymail"))
+
+
+import imaplib
+
+import pytest
+
+
+@pytest.fixture
+def plain_imap(monkeypatch):
+    """IMAPSSLConnectionがSSLを使用せずに接続するようにする"""
+    import mailserverconnection
+
+    class PlainStreamingIMAP4(mailserverconnection._StreamingIMAP4_SSL):
+        def _create_socket(self, timeout):
+            return imaplib.IMAP4._create_socket(self, timeout)
+
+    monkeypatch.setattr(mailserverconnection, "_StreamingIMAP4_SSL", PlainStreamingIMAP4)
+    monkeypatch.setattr(mailserverconnection, "_HEADER_CACHE", mailserverconnection.OrderedDict())
+    monkeypatch.setattr(mailserverconnection, "_CONNECTION_POOL", {})
@@ -0,0 +1,101 @@
+import socket
+import threading
+
+
+class FakeIMAPServer:
+    """テスト用のIMAPサーバ
+
+    1接続ずつコマンドを順に処理し、受信したコマンドをcommandsに記録する。
+    """
+
+    def __init__(self, mails: list[bytes], uid_offset: int = 100, bad_message_sets=(), idle_pushes=(), idle_mails=(),
+                 capabilities=(b"IMAP4rev1", b"IDLE")):
+        """コンストラクタ
+
+        Args:
+            mails (list[bytes]): メールボックスのメール（メッセージ番号順）
+            uid_offset (int, optional): メッセージ番号とUIDの差. Defaults to 100.
+            bad_message_sets (optional): BADを応答するFETCHのメッセージセット
+            idle_pushes (optional): IDLE開始後に送信する応答行
+            idle_mails (optional): IDLE開始時にメールボックスへ追加するメール
+            capabilities (optional): 応答するCAPABILITY
+        """
+        self.mails = [(number, number + uid_offset, raw) for number, raw in enumerate(mails, 1)]
+        self.bad_message_sets = set(bad_message_sets)
+        self.idle_pushes = list(idle_pushes)
+        self.idle_mails = list(idle_mails)
+        self.capabilities = tuple(capabilities)
+        self._uid_offset = uid_offset
+        self.commands = []
+        self._sock = socket.socket()
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen()
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def close(self):
+        self._sock.close()
+
+    def _serve(self):
+        while True:
+            try:
+                client, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _select(self, message_set: str, by_uid: bool) -> list:
+        key = 1 if by_uid else 0
+        max_value = max((mail[key] for mail in self.mails), default=0)
+        selected = []
+        for part in message_set.split(","):
+            first, _, last = part.partition(":")
+            first = max_value if first == "*" else int(first)
+            last = first if not last else (max_value if last == "*" else int(last))
+            first, last = min(first, last), max(first, last)
+            selected += [mail for mail in self.mails if first <= mail[key] <= last]
+        return selected
+
+    def _handle(self, client):
+        reader = client.makefile("rb")
+        client.sendall(b"* OK [CAPABILITY %s] ready\r\n" % b" ".join(self.capabilities))
+        while line := reader.readline():
+            line = line.decode().rstrip("\r\n")
+            self.commands.append(line)
+            tag, command, *rest = line.split(" ", 2)
+            args = rest[0] if rest else ""
+            command = command.upper()
+            if command == "UID":
+                sub_command, args = args.split(" ", 1)
+                command = "UID " + sub_command.upper()
+            response = b""
+            if command == "CAPABILITY":
+                response = b"* CAPABILITY %s\r\n" % b" ".join(self.capabilities)
+            elif command in ("SELECT", "NOOP"):
+                response = b"* %d EXISTS\r\n* OK [UIDVALIDITY 42] ok\r\n" % len(self.mails)
+            elif command == "LOGOUT":
+                client.sendall(b"* BYE\r\n%s OK done\r\n" % tag.encode())
+                break
+            elif command == "IDLE":
+                for raw in self.idle_mails:
+                    number = len(self.mails) + 1
+                    self.mails.append((number, number + self._uid_offset, raw))
+                self.idle_mails = []
+                client.sendall(b"+ idling\r\n" + b"".join(push + b"\r\n" for push in self.idle_pushes))
+                self.commands.append(reader.readline().decode().rstrip("\r\n"))
+            elif command == "UID SEARCH":
+                criteria = args.split()
+                mails = self._select(criteria[-1], True) if "UID" in criteria else self.mails
+                response = b"* SEARCH %s\r\n" % b" ".join(b"%d" % mail[1] for mail in mails)
+            elif command in ("FETCH", "UID FETCH"):
+                message_set, items = args.split(" ", 1)
+                if message_set in self.bad_message_sets:
+                    client.sendall(b"%s BAD maximum request size exceeded\r\n" % tag.encode())
+                    continue
+                for number, uid, raw in self._select(message_set, command == "UID FETCH"):
+                    if "HEADER" in items:
+                        raw = raw.split(b"\r\n\r\n")[0] + b"\r\n\r\n"
+                    response += b'* %d FETCH (UID %d INTERNALDATE "12-Feb-2024 10:20:30 +0900" BODY[] {%d}\r\n%s)\r\n' % (
+                        number, uid, len(raw), raw)
+            client.sendall(response + b"%s OK done\r\n" % tag.encode())
+        client.close()
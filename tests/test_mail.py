@@ -0,0 +1,227 @@
+import tempfile
+from datetime import datetime, timedelta, timezone
+from email.utils import getaddresses
+
+import pytest
+
+import mail as mail_module
+from mail import HTMLMailBody, IMAPMail, PlainTextMailBody
+
+
+def create_mail(headers: bytes, body: bytes = b"body\r\n", **kwargs) -> IMAPMail:
+    raw = headers + b"\r\n" + body
+    msg_data = [(b"1 (RFC822 {%d}" % len(raw), raw), b' INTERNALDATE "12-Feb-2024 10:20:30 +0900")']
+    return IMAPMail(1, msg_data, None, **kwargs)
+
+
+@pytest.mark.parametrize("header, address, name", [
+    ("alice@example.com", "alice@example.com", ""),
+    ("<alice@example.com>", "alice@example.com", ""),
+    ("Alice Smith <alice@example.com>", "alice@example.com", "Alice Smith"),
+    ('"Smith, Alice" <alice@example.com>', "alice@example.com", "Smith, Alice"),
+    ('"Alice Smith" <alice@example.com>', "alice@example.com", "Alice Smith"),
+])
+def test_from_mailaddress(header, address, name):
+    mail = create_mail(f"From: {header}\r\nTo: bob@example.org\r\nSubject: s\r\n".encode())
+
+    from_address = mail.get_from_mailaddress()
+    assert from_address.get_mailaddress() == address
+    assert from_address.get_name() == name
+
+
+def test_str_bare_addresses():
+    mail = create_mail(b"From: alice@example.com\r\nTo: bob@example.org\r\nSubject: s\r\n")
+
+    assert str(mail).startswith("From: alice@example.com,To: bob@example.org, Date: ")
+
+
+def test_to_mailaddress_multiple():
+    mail = create_mail(b"From: a@x.com\r\nTo: Bob <bob@example.org>, carol@example.org\r\nSubject: s\r\n")
+
+    assert [(address.get_name(), address.get_mailaddress()) for address in mail.get_to_mailaddress()] == [
+        ("Bob", "bob@example.org"), ("", "carol@example.org")]
+
+
+def test_from_mailaddress_unbracketed_name_falls_back_to_getaddresses():
+    header = "John john@x.com"
+    mail = create_mail(f"From: {header}\r\nTo: b@x.com\r\nSubject: s\r\n".encode())
+
+    expected = [(name, addr) for name, addr in getaddresses([header]) if addr]
+    assert [(address.get_name(), address.get_mailaddress()) for address in mail._from_address] == expected
+
+
+def create_spooled_mail(headers: bytes, body: bytes, **kwargs) -> tuple[IMAPMail, bytes]:
+    raw = headers + b"\r\n" + body
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(raw)
+    spool.seek(0)
+    msg_data = [(b'1 (UID 1 INTERNALDATE "12-Feb-2024 10:20:30 +0900" BODY[] {%d}' % len(raw), spool), b")"]
+    return IMAPMail(1, msg_data, None, **kwargs), raw
+
+
+@pytest.mark.parametrize("headers_only", [False, True])
+def test_spooled_literal(headers_only):
+    mail, raw = create_spooled_mail(
+        b"From: a@x.com\r\nTo: b@x.com\r\nSubject: large\r\n", b"x" * 4096 + b"\r\n", headers_only=headers_only)
+
+    assert mail.get_subject() == "large"
+    assert mail.get_from_mailaddress().get_mailaddress() == "a@x.com"
+    assert mail.get_mail_binary_data() == raw
+    assert mail.get_body_stream().read() == raw
+
+
+def test_spooled_literal_from_batch_headers_only():
+    mail, _ = create_spooled_mail(b"From: a@x.com\r\nTo: b@x.com\r\nSubject: large\r\n", b"x" * 4096 + b"\r\n")
+
+    mails = IMAPMail.from_batch([(1, mail._msg_data)], None, headers_only=True)
+
+    assert [m.get_subject() for m in mails] == ["large"]
+
+
+@pytest.fixture(params=["fast_mail_parser", "email"])
+def mail_parser(request, monkeypatch):
+    """fast_mail_parser、標準のemailパッケージのそれぞれで解析する"""
+    if request.param == "fast_mail_parser":
+        pytest.importorskip("fast_mail_parser")
+    else:
+        monkeypatch.setattr(mail_module, "parse_email", None)
+    return request.param
+
+
+def test_header_names_are_case_insensitive(mail_parser):
+    mail = create_mail(b"FROM: Alice <alice@example.com>\r\nto: bob@example.org\r\nsubject: hello\r\n")
+
+    assert str(mail.get_from_mailaddress()) == "Alice <alice@example.com>"
+    assert [str(address) for address in mail.get_to_mailaddress()] == ["bob@example.org"]
+    assert mail.get_subject() == "hello"
+    assert str(mail.get_mail_body()) == "body\r\n"
+
+
+@pytest.mark.parametrize("headers_only", [False, True])
+def test_duplicate_headers_use_first_occurrence(mail_parser, headers_only):
+    mail = create_mail(
+        b"From: first@example.com\r\nTo: bob@example.org\r\nFrom: second@example.com\r\nSubject: s\r\n",
+        headers_only=headers_only)
+
+    assert mail.get_from_mailaddress().get_mailaddress() == "first@example.com"
+    assert [str(address) for address in mail.get_to_mailaddress()] == ["bob@example.org"]
+
+
+@pytest.mark.parametrize("msg_data, expected", [
+    # INTERNALDATEがリテラルの前にある場合
+    ([(b'1 (UID 1 INTERNALDATE "12-Feb-2024 10:20:30 +0900" BODY[] {4}', b"a\r\n\r\n")],
+     datetime(2024, 2, 12, 10, 20, 30, tzinfo=timezone(timedelta(hours=9)))),
+    # INTERNALDATEがリテラルの後にある場合、日が1桁（先頭が空白）、負のタイムゾーン
+    ([(b"1 (UID 1 BODY[] {4}", b"a\r\n\r\n"), b' INTERNALDATE " 2-Dec-2023 23:05:09 -0130")'],
+     datetime(2023, 12, 2, 23, 5, 9, tzinfo=timezone(-timedelta(hours=1, minutes=30)))),
+])
+def test_reception_datetime(msg_data, expected):
+    reception_datetime = IMAPMail(1, msg_data, None).get_reception_datetime()
+
+    assert reception_datetime == expected
+    assert reception_datetime.tzinfo is not None
+
+
+@pytest.fixture(params=["selectolax", "lxml", "html.parser"])
+def html_parser(request, monkeypatch):
+    """selectolax、lxml、標準のHTMLParserのそれぞれでテキストを抽出する"""
+    if request.param == "selectolax":
+        pytest.importorskip("selectolax.lexbor")
+    else:
+        monkeypatch.setattr(mail_module, "_LexborParser", None)
+    if request.param == "lxml":
+        pytest.importorskip("lxml.html")
+    elif request.param == "html.parser":
+        monkeypatch.setattr(mail_module, "_lxml_html", None)
+    return request.param
+
+
+@pytest.mark.parametrize("content, text", [
+    ("<p>Hello <b>World</b></p>", "Hello World"),
+    ("<html><body>\n<p>a &amp; b</p>\n<p>c</p>\n</body></html>", "a & bc"),
+    ('<?xml version="1.0" encoding="utf-8"?>\n<html><body><p>Hi <i>there</i></p></body></html>', "Hi there"),
+    ("", ""),
+])
+def test_html_mail_body_text(html_parser, content, text):
+    assert str(HTMLMailBody("text/html", content)) == text
+
+
+def test_malformed_base64_falls_back_to_email_package(mail_parser):
+    mail = create_mail(
+        b"From: alice@example.com\r\nTo: bob@example.org\r\nSubject: broken\r\nMIME-Version: 1.0\r\n"
+        b"Content-Type: text/plain; charset=utf-8\r\nContent-Transfer-Encoding: base64\r\n",
+        b"aGVsbG8=!!\r\n")
+
+    assert mail.get_from_mailaddress().get_mailaddress() == "alice@example.com"
+    assert mail.get_subject() == "broken"
+    assert str(mail.get_mail_body()) == "hello"
+
+
+MULTIPART_HEADERS = (b"From: a@example.com\r\nTo: b@example.com\r\nSubject: s\r\nMIME-Version: 1.0\r\n"
+                     b"Content-Type: multipart/%s; boundary=BOUNDARY\r\n")
+
+
+@pytest.mark.parametrize("subtype, parts, body_class, text", [
+    # テキスト部分とHTML部分がある場合はテキスト部分を本文とする
+    ("alternative",
+     [b"Content-Type: text/html; charset=utf-8\r\n\r\n<p>html <b>body</b></p>",
+      b"Content-Type: text/plain; charset=utf-8\r\n\r\nplain body"],
+     PlainTextMailBody, "plain body"),
+    # HTML部分のみの場合はHTML部分を本文とする
+    ("alternative",
+     [b"Content-Type: text/html; charset=utf-8\r\n\r\n<p>html <b>body</b></p>"],
+     HTMLMailBody, "html body"),
+    # 添付ファイルのテキストは本文としない
+    ("mixed",
+     [b"Content-Type: text/plain; charset=utf-8\r\nContent-Disposition: attachment; filename=a.txt\r\n\r\n"
+      b"attached text",
+      b"Content-Type: text/plain; charset=utf-8\r\n\r\nplain body"],
+     PlainTextMailBody, "plain body"),
+])
+def test_mail_body_selects_part(mail_parser, subtype, parts, body_class, text):
+    body = b"".join(b"--BOUNDARY\r\n" + part + b"\r\n" for part in parts) + b"--BOUNDARY--\r\n"
+    mail = create_mail(MULTIPART_HEADERS % subtype.encode(), body)
+
+    mail_body = mail.get_mail_body()
+    assert isinstance(mail_body, body_class)
+    assert str(mail_body).strip() == text
+
+
+@pytest.mark.parametrize("content_type, payload, expected", [
+    # 指定の文字コードでデコードする
+    (b"text/plain; charset=iso-2022-jp", "日本語".encode("iso-2022-jp"),
+     {"fast_mail_parser": "日本語", "email": "日本語"}),
+    (b"text/plain; charset=shift_jis", "日本語".encode("shift_jis"),
+     {"fast_mail_parser": "日本語", "email": "日本語"}),
+    # 未知の文字コード
+    (b"text/plain; charset=x-unknown", "café".encode(),
+     {"fast_mail_parser": "caf\ufffd\ufffd", "email": "café"}),
+    # 文字コードの指定なし
+    (b"text/plain", "café".encode(),
+     {"fast_mail_parser": "cafÃ©", "email": "café"}),
+    # BOMと指定の文字コードが異なる場合
+    (b"text/plain; charset=utf-8", b"\xff\xfeab",
+     {"fast_mail_parser": "\u6261", "email": "ab"}),
+])
+def test_mail_body_charset(mail_parser, content_type, payload, expected):
+    mail = create_mail(
+        b"From: a@example.com\r\nTo: b@example.com\r\nSubject: s\r\nMIME-Version: 1.0\r\nContent-Type: " + content_type
+        + b"\r\n", payload)
+
+    assert str(mail.get_mail_body()) == expected[mail_parser]
+
+
+@pytest.mark.parametrize("charset, payload, text", [
+    # ASCII文字のみの本文はASCIIとしてデコードする
+    (b"utf-8", b"plain ascii body", "plain ascii body"),
+    (b"us-ascii", b"plain ascii body", "plain ascii body"),
+    # ASCII以外の文字を含む本文は指定の文字コードでデコードする
+    (b"utf-8", "héllo 日本語".encode(), "héllo 日本語"),
+    (b"iso-8859-1", "héllo".encode("iso-8859-1"), "héllo"),
+])
+def test_mail_body_ascii_fast_path(mail_parser, charset, payload, text):
+    mail = create_mail(
+        b"From: a@example.com\r\nTo: b@example.com\r\nSubject: s\r\nMIME-Version: 1.0\r\n"
+        b"Content-Type: text/plain; charset=" + charset + b"\r\n", payload)
+
+    assert str(mail.get_mail_body()) == text
@@ -0,0 +1,36 @@
+import pytest
+
+from mailaddress import MailAddress
+
+
+@pytest.mark.parametrize("address, user, base, tag, domain", [
+    ("alice@example.com", "alice", "alice", "", "example.com"),
+    ("alice+news@example.com", "alice+news", "alice", "news", "example.com"),
+    ("alice+@example.com", "alice+", "alice", "", "example.com"),
+    ("a+b+c@mail.example.co.jp", "a+b+c", "a", "b+c", "mail.example.co.jp"),
+    ("@example.com", "", "", "", "example.com"),
+])
+def test_split_mailaddress(address, user, base, tag, domain):
+    mailaddress = MailAddress(address, "")
+
+    assert mailaddress.get_mailaddress_user_area() == user
+    assert mailaddress.get_plusaddresss_basename() == base
+    assert mailaddress.get_plusaddress_tagname() == tag
+    assert mailaddress.get_mailaddress_dmain_area() == domain
+    assert mailaddress.is_plusaddress() == ("+" in user)
+
+
+def test_invalid_mailaddress():
+    with pytest.raises(ValueError):
+        MailAddress("alice.example.com", "")
+
+
+@pytest.mark.parametrize("name, text", [
+    ("Alice", "Alice <alice@example.com>"),
+    ("", "alice@example.com"),
+])
+def test_str(name, text):
+    mailaddress = MailAddress("alice@example.com", name)
+
+    assert mailaddress.has_name() == bool(name)
+    assert str(mailaddress) == text
@@ -0,0 +1,363 @@
+import asyncio
+import time
+
+import pytest
+
+from exception.dpymailexception import MailLoadException, MailMonitoringTimeoutException
+from fake_imap_server import FakeIMAPServer
+from mailserverconnection import (AsyncIMAPSSLConnection, AsyncMailCheckPoint, FetchProfile, IMAPSSLConnection,
+                                  MailCheckPoint, _find_fetch_uid, _parse_uids, _to_message_set, close_pool)
+
+
+def create_raw_mail(number: int) -> bytes:
+    return b"From: s%d@example.com\r\nTo: t@example.com\r\nSubject: subject %d\r\n\r\nbody %d\r\n" % (
+        number, number, number)
+
+
+@pytest.fixture
+def server():
+    server = FakeIMAPServer([create_raw_mail(number) for number in range(1, 11)])
+    yield server
+    server.close()
+
+
+def connect(server: FakeIMAPServer, **kwargs) -> IMAPSSLConnection:
+    return IMAPSSLConnection("127.0.0.1", server.port, "user", "password", **kwargs)
+
+
+@pytest.mark.parametrize("uid_list, message_set", [
+    ([], b""),
+    ([5], b"5"),
+    ([1, 2, 3, 5, 7, 8], b"1:3,5,7:8"),
+    (range(10, 14), b"10:13"),
+    ([3, 2, 1], b"3,2,1"),
+])
+def test_to_message_set(uid_list, message_set):
+    assert _to_message_set(uid_list) == message_set
+
+
+@pytest.mark.parametrize("raw, tail_count, uid_list", [
+    (b"1 2 3 4 5", None, [1, 2, 3, 4, 5]),
+    (b"1 2 3 4 5", 2, [4, 5]),
+    (b"1 2 3 4 5\r\n", 1, [5]),
+    (b"1 2 3", 5, [1, 2, 3]),
+    (b"7", 1, [7]),
+    (b"1 2 3", 0, []),
+])
+def test_parse_uids(raw, tail_count, uid_list):
+    assert _parse_uids(raw, tail_count) == uid_list
+
+
+def test_find_fetch_uid_after_literal():
+    assert _find_fetch_uid([(b"1 (BODY[] {4}", b"UID "), b" UID 101)"]) == 101
+    assert _find_fetch_uid([(b"1 (BODY[] {4}", b"a\r\n\r\n"), b")"]) is None
+
+
+def test_pipelined_fetch_returns_mails_in_order(plain_imap, server):
+    connection = connect(server, fetch_batch_size=3)
+
+    mails = list(connection._fetch_many([101, 102, 103, 104, 105, 107]))
+
+    assert [mail._uid for mail in mails] == [101, 102, 103, 104, 105, 107]
+    assert [mail.get_subject() for mail in mails][-1] == "subject 7"
+    fetches = [command.split(" ", 1)[1] for command in server.commands if " FETCH " in command]
+    assert fetches == [
+        "UID FETCH 101:103 (UID INTERNALDATE BODY.PEEK[])",
+        "UID FETCH 104:105,107 (UID INTERNALDATE BODY.PEEK[])",
+    ]
+
+
+def test_pipelined_fetch_bad_response_raises_mail_load_exception(plain_imap, server):
+    server.bad_message_sets.add("101:102")
+    connection = connect(server, fetch_batch_size=2)
+
+    with pytest.raises(MailLoadException):
+        list(connection._fetch_many([101, 102, 103, 104, 105]))
+
+    # 後続のFETCHの応答が読み残されず、次のコマンドに混入しない
+    assert "FETCH" not in connection.imap.untagged_responses
+    assert connection.imap.tagged_commands == {}
+    mails = list(connection._fetch_many([106]))
+    assert [mail.get_subject() for mail in mails] == ["subject 6"]
+
+
+@pytest.mark.parametrize("pushes, expected", [
+    ([b"* 11 EXISTS"], True),
+    ([b"* 3 EXPUNGE"], True),
+    ([b"* 3 FETCH (FLAGS (\\Seen))"], False),
+    # DONEまでの応答をすべて読み込む
+    ([b"* 3 FETCH (FLAGS (\\Seen))", b"* 11 EXISTS", b"* 1 RECENT"], True),
+    ([], False),
+])
+def test_idle_reports_mailbox_changes(plain_imap, server, pushes, expected):
+    server.idle_pushes = pushes
+    connection = connect(server)
+
+    assert connection.idle(0.2) is expected
+    # IDLEの応答が読み残されず、次のコマンドが実行できる
+    assert [mail._uid for mail in connection._fetch_many([110])] == [110]
+
+
+def test_checkpoint_reuses_result_within_ttl(plain_imap, server):
+    connection = connect(server)
+    checkpoint = MailCheckPoint(connection, next(connection._fetch_many([108])))
+
+    def count_searches():
+        return sum(" UID SEARCH " in command for command in server.commands)
+
+    first = checkpoint.get_mails_over_than_checkpoint(60)
+    assert [mail._uid for mail in first] == [109, 110]
+    assert checkpoint.get_mails_over_than_checkpoint(60) is first
+    assert count_searches() == 1
+
+    # チェックポイントメールが変わった場合、キャッシュを使用しない
+    checkpoint._checkpoint_mail = first[0]
+    assert [mail._uid for mail in checkpoint.get_mails_over_than_checkpoint(60)] == [110]
+    assert count_searches() == 2
+
+    checkpoint._invalidate_cached_mails()
+    checkpoint.get_mails_over_than_checkpoint(60)
+    checkpoint.get_mails_over_than_checkpoint()
+    assert count_searches() == 4
+
+
+def test_monitoring_wakes_on_push_sent_with_idle_continuation(plain_imap, server):
+    # 継続応答と同じパケットで新着メールを通知する
+    server.idle_mails = [create_raw_mail(11)]
+    server.idle_pushes = [b"* 11 EXISTS"]
+    connection = connect(server)
+    checkpoint = MailCheckPoint(connection, next(connection._fetch_many([110])))
+    subjects = []
+
+    def on_new_mails(mails):
+        subjects.extend(mail.get_subject() for mail in mails)
+        return True
+
+    start_time = time.monotonic()
+    checkpoint.monitoring_new_mails(on_new_mails, 5, 10)
+
+    assert subjects == ["subject 11"]
+    assert time.monotonic() - start_time < 2
+
+
+def test_lastest_mail_by_count_uses_exists_count(plain_imap, server):
+    connection = connect(server, fetch_batch_size=2)
+
+    mails = connection.lastest_mail_by_count(3)
+
+    assert [mail._uid for mail in mails] == [108, 109, 110]
+    commands = [command.split(" ", 1)[1] for command in server.commands]
+    assert "NOOP" in commands
+    assert not any(command.startswith("STATUS") for command in commands)
+    assert [command for command in commands if command.startswith("FETCH")] == [
+        "FETCH 8:9 (UID INTERNALDATE BODY.PEEK[])",
+        "FETCH 10 (UID INTERNALDATE BODY.PEEK[])",
+    ]
+
+
+def test_lastest_mail_by_count_reselects_after_expunge(plain_imap, server):
+    server.idle_pushes.append(b"* 3 EXPUNGE")
+    connection = connect(server)
+    assert connection.idle(1)
+
+    assert [mail._uid for mail in connection.lastest_mail_by_count(1)] == [110]
+    assert sum(" SELECT " in command for command in server.commands) == 2
+
+
+def test_acquire_reuses_released_connection(plain_imap, server):
+    def count_logins():
+        return sum(" LOGIN " in command for command in server.commands)
+
+    connection = IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "password")
+    connection.release()
+
+    assert IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "password") is connection
+    assert count_logins() == 1
+
+    # 返却済みの接続はプールから取り出されるため、次の取得では新しく接続する
+    other = IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "password")
+    assert other is not connection
+    assert count_logins() == 2
+
+
+def test_acquire_does_not_reuse_connection_with_other_password(plain_imap, server):
+    connection = IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "password")
+    connection.release()
+
+    other = IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "wrong password")
+    assert other is not connection
+    assert IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "password") is connection
+
+
+def test_close_pool_disconnects_released_connections(plain_imap, server):
+    IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "password").release()
+
+    close_pool()
+
+    assert server.commands[-1].endswith(" LOGOUT")
+    assert IMAPSSLConnection.acquire("127.0.0.1", server.port, "user", "password") is not None
+    assert sum(" LOGIN " in command for command in server.commands) == 2
+
+
+def test_parallel_fetch_keeps_order_and_pools_connections(plain_imap, server):
+    import mailserverconnection
+
+    def count_logins():
+        return sum(" LOGIN " in command for command in server.commands)
+
+    connection = connect(server)
+    uid_list = list(range(101, 111))
+
+    for _ in range(2):
+        mails = connection.parallel_fetch(uid_list, n_conn=3)
+        assert [mail._uid for mail in mails] == uid_list
+        assert [mail.get_subject() for mail in mails] == [f"subject {number}" for number in range(1, 11)]
+
+    # 作成した3つの接続はすべてプールに返却され、2回目の呼び出しで再利用される
+    assert len(mailserverconnection._CONNECTION_POOL[connection._pool_key()]) == 3
+    assert connection not in mailserverconnection._CONNECTION_POOL[connection._pool_key()]
+    assert count_logins() == 1 + 3
+
+    close_pool()
+    assert sum(command.endswith(" LOGOUT") for command in server.commands) == 3
+
+
+def test_large_literal_is_spooled_to_file(plain_imap, tmp_path):
+    body = b"".join(b"%07d %s\r\n" % (line, b"x" * 70) for line in range(16 * 1024))
+    raw = b"From: a@example.com\r\nTo: b@example.com\r\nSubject: large\r\n\r\n" + body
+    assert len(raw) >= 1024 * 1024
+    server = FakeIMAPServer([raw])
+    try:
+        mail = next(connect(server)._fetch_many([101]))
+    finally:
+        server.close()
+
+    # リテラルはbytesではなく、ディスク上の一時ファイルに書き出されている
+    spool = mail._msg_data[0][1]
+    assert not isinstance(spool, bytes)
+    assert spool._rolled
+
+    assert mail.get_subject() == "large"
+    assert mail.get_mail_binary_data() == raw
+    with open(mail.save_to_file(str(tmp_path)), "rb") as f:
+        assert f.read() == raw
+
+
+def test_split_fetch_response():
+    connection = IMAPSSLConnection.__new__(IMAPSSLConnection)
+    data = [
+        (b'1 (UID 101 INTERNALDATE "12-Feb-2024 10:20:30 +0900" BODY[] {3}', b"one"),
+        b")",
+        (b"2 (BODY[] {3}", b"two"),
+        b" UID 102)",
+        None,
+    ]
+
+    assert connection._split_fetch_response(data) == {
+        101: [data[0], b")"],
+        102: [data[2], b" UID 102)"],
+    }
+
+
+def test_async_split_fetch_response():
+    connection = AsyncIMAPSSLConnection.__new__(AsyncIMAPSSLConnection)
+    lines = [
+        b'1 FETCH (UID 101 INTERNALDATE "12-Feb-2024 10:20:30 +0900" BODY[] {3}',
+        bytearray(b"one"),
+        b")",
+        b"2 FETCH (BODY[] {3}",
+        bytearray(b"two"),
+        b" UID 102)",
+        b"FETCH completed.",
+    ]
+
+    assert connection._split_fetch_response(lines) == {
+        101: [(b'1 (UID 101 INTERNALDATE "12-Feb-2024 10:20:30 +0900" BODY[] {3}', b"one"), b")"],
+        102: [(b"2 (BODY[] {3}", b"two"), b" UID 102)"],
+    }
+
+
+def test_checkpoint_poll_reuses_cached_headers(plain_imap, server):
+    connection = connect(server)
+    checkpoint = MailCheckPoint(connection, next(connection._fetch_many([108])))
+
+    def fetches():
+        return [command.split(" ", 1)[1] for command in server.commands if " FETCH " in command]
+
+    checkpoint.get_mails_over_than_checkpoint()
+    mails = checkpoint.get_mails_over_than_checkpoint()
+
+    # 2回目のポーリングはヘッダ情報のキャッシュを使用し、FETCHしない
+    assert fetches()[1:] == ["UID FETCH 109:110 (UID INTERNALDATE BODY.PEEK[HEADER])"]
+    # 本文は参照された時点でロードする
+    assert mails[-1].get_mail_binary_data() == create_raw_mail(10)
+    assert fetches()[-1] == "UID FETCH 110 (UID INTERNALDATE BODY.PEEK[])"
+
+
+@pytest.mark.parametrize("capabilities, pushes, searches", [
+    # メールボックスの変化を伴わない通知でIDLEを早く終えた場合は、直近の取得結果を再利用する
+    ((b"IMAP4rev1", b"IDLE"), [b"* 3 FETCH (FLAGS (\\Seen))"], 1),
+    # メールボックスの変化を通知された場合は再取得する
+    ((b"IMAP4rev1", b"IDLE"), [b"* 10 EXISTS"], 3),
+    # IDLEに対応していない場合は再利用しない
+    ((b"IMAP4rev1",), [], 3),
+])
+def test_monitoring_reuses_result_only_after_early_idle(plain_imap, server, capabilities, pushes, searches):
+    server.capabilities = capabilities
+    server.idle_pushes = pushes
+    connection = connect(server)
+    checkpoint = MailCheckPoint(connection, next(connection._fetch_many([109])))
+    polls = []
+
+    def on_new_mails(mails):
+        polls.append([mail._uid for mail in mails])
+        return len(polls) == 3
+
+    checkpoint.monitoring_new_mails(on_new_mails, 1, 10)
+
+    assert polls == [[110]] * 3
+    assert sum(" UID SEARCH " in command for command in server.commands) == searches
+
+
+@pytest.mark.parametrize("fetch_profile", [FetchProfile.HEADERS_ONLY, FetchProfile.ENVELOPE])
+def test_async_header_only_mail_requires_load_mail_body(monkeypatch, server, fetch_profile):
+    aioimaplib = pytest.importorskip("aioimaplib")
+    monkeypatch.setattr(aioimaplib, "IMAP4_SSL", aioimaplib.IMAP4)
+
+    async def run():
+        connection = await AsyncIMAPSSLConnection("127.0.0.1", server.port, "user", "password").connect()
+        try:
+            mail = (await connection._fetch_many([103], fetch_profile))[0]
+            assert mail.get_subject() == "subject 3"
+            with pytest.raises(MailLoadException):
+                mail.get_mail_binary_data()
+            assert await connection.load_mail_body(mail) is mail
+            return mail.get_mail_binary_data()
+        finally:
+            await connection.disconnect()
+
+    assert asyncio.run(run()) == create_raw_mail(3)
+
+
+def test_async_monitoring_waits_full_interval_after_idle_timeout(monkeypatch, server):
+    aioimaplib = pytest.importorskip("aioimaplib")
+    monkeypatch.setattr(aioimaplib, "IMAP4_SSL", aioimaplib.IMAP4)
+
+    async def run():
+        connection = await AsyncIMAPSSLConnection("127.0.0.1", server.port, "user", "password").connect()
+        try:
+            # タイムアウトしたIDLEが連続しても、毎回指定の秒数だけ待機する
+            for _ in range(2):
+                start_time = time.monotonic()
+                assert await connection.idle(0.3) is False
+                assert time.monotonic() - start_time >= 0.25
+
+            checkpoint = AsyncMailCheckPoint(connection, (await connection._fetch_many([110]))[0])
+            with pytest.raises(MailMonitoringTimeoutException):
+                await checkpoint.monitoring_new_mails(lambda mails: True, 0.3, 1)
+        finally:
+            await connection.disconnect()
+
+    asyncio.run(run())
+    # 監視中のIDLEは1秒間に0.3秒ずつの最大4回
+    assert sum(command.endswith(" IDLE") for command in server.commands) <= 2 + 4